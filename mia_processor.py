@@ -9,27 +9,132 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
+import os
 import re
-from dataclasses import asdict, dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
 
 try:
-    import pymupdf4llm
+    import pymupdf
     import requests
-    from bs4 import BeautifulSoup
-    from markdownify import markdownify as md
+    from bs4 import BeautifulSoup, SoupStrainer
+    from markdownify import MarkdownConverter
+    from pymupdf4llm.helpers import pymupdf_rag
+    from requests.adapters import HTTPAdapter
+    from selectolax.lexbor import LexborHTMLParser
+    from urllib3.util.retry import Retry
 except ImportError as e:
     print(f"Missing dependency: {e}")
     print(
-        "Install with: pip install requests beautifulsoup4 markdownify pymupdf4llm --break-system-packages"
+        "Install with: pip install requests beautifulsoup4 lxml markdownify pymupdf4llm selectolax --break-system-packages"
     )
     exit(1)
 
 
-@dataclass
+# Only the <body> subtree is needed for markdown; metadata comes from <head>
+# via the Lexbor tree, so skip building BeautifulSoup nodes for everything else
+BODY_STRAINER = SoupStrainer("body")
+MARKDOWN_CONVERTER = MarkdownConverter(heading_style="ATX")
+
+# Language directories skipped during the archive walk
+NON_ENGLISH_DIRS = frozenset(
+    {
+        "chinese",
+        "deutsch",
+        "espanol",
+        "francais",
+        "italiano",
+        "japanese",
+        "polski",
+        "portugues",
+        "russian",
+        "turkce",
+        "arabic",
+        "svenska",
+        "catala",
+        "greek",
+        "korean",
+        "farsi",
+    }
+)
+# Runs of two or more blank (whitespace-only) lines. Any whitespace but "\n"
+# may sit between the newlines (including the \xa0 left by &nbsp; spacers), so
+# there is no \s* overlap for the engine to backtrack over
+BLANK_LINES_RE = re.compile(r"\n(?:[^\S\n]*\n){2,}")
+NON_ENGLISH_PATH_RE = re.compile(r"/(?:" + "|".join(sorted(NON_ENGLISH_DIRS)) + r")/")
+
+MIA_BASE_URL = "https://www.marxists.org"
+
+# Filename sanitizing for save_document. ASCII titles (the vast majority)
+# drop stripped characters with a single str.translate pass; the table is
+# derived from the regex so both paths remove exactly the same characters
+SAFE_TITLE_STRIP_RE = re.compile(r"[^\w\s-]")
+SAFE_TITLE_JOIN_RE = re.compile(r"[-\s]+")
+SAFE_TITLE_ASCII_TABLE = str.maketrans(
+    {c: None for c in map(chr, range(128)) if SAFE_TITLE_STRIP_RE.match(c)}
+)
+
+# YAML front matter written ahead of every markdown document
+HEADER_TEMPLATE = """---
+title: {title}
+author: {author}
+source_url: {source_url}
+date: {date}
+language: {language}
+doc_type: {doc_type}
+word_count: {word_count}
+processed_date: {processed_date}
+---
+
+"""
+
+# Pages containing any of these go through markdownify; everything else is
+# linear prose that the simple walker renders straight from the Lexbor tree.
+# The walker mirrors markdownify's whitespace handling and its conversions for
+# paragraphs, headings, lists, blockquotes, links, images and emphasis; every
+# other tag markdownify converts specially is listed here. markdownify reads a
+# BeautifulSoup tree that lxml rebuilds from Lexbor's output, and lxml closes
+# the parent when one of the child pairs below opens, so those go there too
+COMPLEX_MARKUP_SELECTOR = ", ".join(
+    [
+        "table, pre, code, li li li, dl, dt, dd, ol[start], s, del, strike, kbd, samp",
+        "q, figcaption, video",
+        "b > p, i > p, u > p, tt > p, big > p, small > p",
+        "b > center, i > center, font > center",
+        "address > ul, address > li, ul > address",
+        *(f"h{n} > p, h{n} > li" for n in range(1, 7)),
+    ]
+)
+# Elements markdownify strips surrounding whitespace from; text outside them
+# is inline and keeps its spacing
+BLOCK_TAGS = frozenset(
+    {"p", "div", "article", "section", "blockquote", "ul", "ol", "li"}
+    | {f"h{n}" for n in range(1, 7)}
+)
+HEADING_LEVELS = {f"h{n}": n for n in range(1, 7)}
+# Markers for markdownify's inline conversions; sub/sup have none by default
+EMPHASIS_MARKS = {"b": "**", "strong": "**", "i": "*", "em": "*", "sub": "", "sup": ""}
+LIST_BULLETS = "*+-"
+# Whitespace rules copied from markdownify so both converters agree byte for byte
+NEWLINE_WHITESPACE_RE = re.compile(r"[\t \r\n]*[\r\n][\t \r\n]*")
+INLINE_WHITESPACE_RE = re.compile(r"[\t ]+")
+ALL_WHITESPACE_RE = re.compile(r"[\t \r\n]+")
+EDGE_NEWLINES_RE = re.compile(r"^(\n*)((?:.*[^\n])?)(\n*)$", flags=re.DOTALL)
+LINE_RE = re.compile(r"^(.*)", flags=re.MULTILINE)
+
+# Resume index entries are flushed to disk after this many saved documents
+PROCESSED_INDEX_FLUSH_EVERY = 500
+
+# PDFs longer than this are converted in page ranges spread across workers
+PDF_PAGES_PER_TASK = 20
+
+
+@dataclass(slots=True)
 class DocumentMetadata:
     """Metadata for each processed document"""
 
@@ -45,11 +150,429 @@ class DocumentMetadata:
     word_count: int = 0
 
 
+# Conversion functions live at module level so ProcessPoolExecutor workers
+# can pickle them; MIAProcessor keeps thin method wrappers for callers.
+
+
+def _is_block(node) -> bool:
+    """Whether markdownify strips whitespace next to and inside this node"""
+    return node is not None and node.tag in BLOCK_TAGS
+
+
+def _is_content(node) -> bool:
+    """Whether a node is an element or non-blank text, as markdownify sees it"""
+    if node.tag == "-text":
+        return node.text(deep=False).strip() != ""
+    return node.tag != "-comment"
+
+
+def _skip_node(node, inside_block: bool) -> bool:
+    """Whether markdownify drops a child before converting its parent"""
+    if node.tag == "-comment":
+        return True
+    if node.tag != "-text" or node.text(deep=False).strip():
+        return False
+    if inside_block and (node.prev is None or node.next is None):
+        return True
+    return _is_block(node.prev) or _is_block(node.next)
+
+
+def _text_markdown(node) -> str:
+    """Render a Lexbor text node, collapsing whitespace and escaping emphasis"""
+    text = NEWLINE_WHITESPACE_RE.sub("\n", node.text(deep=False))
+    text = INLINE_WHITESPACE_RE.sub(" ", text)
+    text = text.replace("*", r"\*").replace("_", r"\_")
+    parent_block = _is_block(node.parent)
+    if _is_block(node.prev) or (parent_block and node.prev is None):
+        text = text.lstrip(" \t\r\n")
+    if _is_block(node.next) or (parent_block and node.next is None):
+        text = text.rstrip()
+    return text
+
+
+def _has_ancestor(node, tags) -> bool:
+    """Whether any ancestor of a node has one of the given tags"""
+    parent = node.parent
+    while parent is not None:
+        if parent.tag in tags:
+            return True
+        parent = parent.parent
+    return False
+
+
+def _chomp(text: str) -> tuple[str, str, str]:
+    """Split edge spaces off inline text so markup hugs the words"""
+    prefix = " " if text and text[0] == " " else ""
+    suffix = " " if text and text[-1] == " " else ""
+    return prefix, suffix, text.strip()
+
+
+def _heading_markdown(node, text: str) -> str:
+    """Render an h1-h6 node as an ATX heading"""
+    if _has_ancestor(node, HEADING_LEVELS):
+        return text
+    text = ALL_WHITESPACE_RE.sub(" ", text.strip())
+    return f"\n\n{'#' * HEADING_LEVELS[node.tag]} {text}\n\n"
+
+
+def _paragraph_markdown(node, text: str) -> str:
+    """Render a p node as a paragraph"""
+    text = text.strip(" \t\r\n")
+    if _has_ancestor(node, HEADING_LEVELS):
+        return f" {text} "
+    return f"\n\n{text}\n\n" if text else ""
+
+
+def _section_markdown(node, text: str) -> str:
+    """Render a div, article or section node as a paragraph"""
+    text = text.strip()
+    if _has_ancestor(node, HEADING_LEVELS):
+        return f" {text} "
+    return f"\n\n{text}\n\n" if text else ""
+
+
+def _blockquote_markdown(node, text: str) -> str:
+    """Render a blockquote node with every line quoted"""
+    text = text.strip(" \t\r\n")
+    if _has_ancestor(node, HEADING_LEVELS):
+        return f" {text} "
+    if not text:
+        return "\n"
+    text = LINE_RE.sub(lambda m: "> " + m.group(1) if m.group(1) else ">", text)
+    return f"\n{text}\n\n"
+
+
+def _list_markdown(node, text: str) -> str:
+    """Render a ul/ol node; its items are already rendered"""
+    if _has_ancestor(node, ("li",)):
+        return "\n" + text.rstrip()
+    sibling = node.next
+    while sibling is not None and not _is_content(sibling):
+        sibling = sibling.next
+    before_paragraph = sibling is not None and sibling.tag not in ("ul", "ol")
+    return "\n\n" + text + ("\n" if before_paragraph else "")
+
+
+def _list_item_markdown(node, text: str) -> str:
+    """Render an li node's content behind its bullet or number"""
+    text = text.strip()
+    if not text:
+        return "\n"
+    parent = node.parent
+    if parent is not None and parent.tag == "ol":
+        siblings = 0
+        sibling = node.prev
+        while sibling is not None:
+            siblings += sibling.tag == "li"
+            sibling = sibling.prev
+        bullet = f"{siblings + 1}. "
+    else:
+        depth = -1
+        ancestor = node
+        while ancestor is not None:
+            depth += ancestor.tag == "ul"
+            ancestor = ancestor.parent
+        bullet = f"{LIST_BULLETS[depth % len(LIST_BULLETS)]} "
+    indent = " " * len(bullet)
+    text = LINE_RE.sub(lambda m: indent + m.group(1) if m.group(1) else "", text)
+    return f"{bullet}{text[len(bullet) :]}\n"
+
+
+def _rule_markdown(_node, _text: str) -> str:
+    """Render an hr node as a thematic break"""
+    return "\n\n---\n\n"
+
+
+def _line_break_markdown(node, text: str) -> str:
+    """Render a br node as a hard line break; headings get a space"""
+    if _has_ancestor(node, HEADING_LEVELS):
+        return text + " " if text else " "
+    return "  \n" + text
+
+
+def _title_part(node) -> str:
+    """Render a node's title attribute as a markdown link title"""
+    title = node.attributes.get("title")
+    return ' "{}"'.format(title.replace('"', r"\"")) if title else ""
+
+
+def _image_markdown(node, _text: str) -> str:
+    """Render an img node; headings keep only the alt text"""
+    alt = node.attributes.get("alt") or ""
+    if _has_ancestor(node, HEADING_LEVELS):
+        return alt
+    return f"![{alt}]({node.attributes.get('src') or ''}{_title_part(node)})"
+
+
+def _link_markdown(node, text: str) -> str:
+    """Render an a node as a link, or an autolink when it shows its own href"""
+    prefix, suffix, text = _chomp(text)
+    if not text:
+        return ""
+    href = node.attributes.get("href")
+    if not href:
+        return text
+    title_part = _title_part(node)
+    if text.replace(r"\_", "_") == href and not title_part:
+        return f"<{href}>"
+    return f"{prefix}[{text}]({href}{title_part}){suffix}"
+
+
+def _emphasis_markdown(node, text: str) -> str:
+    """Wrap an inline node's content in its emphasis mark"""
+    prefix, suffix, text = _chomp(text)
+    if not text:
+        return ""
+    mark = EMPHASIS_MARKS[node.tag]
+    return f"{prefix}{mark}{text}{mark}{suffix}"
+
+
+# Conversion per tag, after markdownify's convert_<tag> methods; tags without
+# one pass their content through
+TAG_CONVERTERS = {
+    **dict.fromkeys(HEADING_LEVELS, _heading_markdown),
+    **dict.fromkeys(EMPHASIS_MARKS, _emphasis_markdown),
+    "p": _paragraph_markdown,
+    **dict.fromkeys(("div", "article", "section"), _section_markdown),
+    "blockquote": _blockquote_markdown,
+    "ul": _list_markdown,
+    "ol": _list_markdown,
+    "li": _list_item_markdown,
+    "hr": _rule_markdown,
+    "br": _line_break_markdown,
+    "img": _image_markdown,
+    "a": _link_markdown,
+}
+
+
+def _node_markdown(node) -> str:
+    """Render a Lexbor node the way markdownify's process_tag would"""
+    if node.tag == "-text":
+        return _text_markdown(node)
+
+    inside_block = _is_block(node)
+    child_strings = []
+    for child in node.iter(include_text=True):
+        if _skip_node(child, inside_block):
+            continue
+        child_text = _node_markdown(child)
+        if not child_text:
+            continue
+        # Collapse newlines at child boundaries to at most one blank line
+        leading, content, trailing = EDGE_NEWLINES_RE.match(child_text).groups()
+        if child_strings and child_strings[-1] and leading:
+            previous = child_strings.pop()
+            leading = "\n" * min(2, max(len(previous), len(leading)))
+        child_strings.extend((leading, content, trailing))
+    text = "".join(child_strings)
+    converter = TAG_CONVERTERS.get(node.tag)
+    return converter(node, text) if converter else text
+
+
+def simple_markdown(body) -> str:
+    """Render a structurally simple page body directly from the Lexbor tree
+
+    Produces the same text markdownify does for the tags it handles; pages
+    matching COMPLEX_MARKUP_SELECTOR use markdownify itself.
+    """
+    body.merge_text_nodes()
+    return _node_markdown(body).strip("\n")
+
+
+def count_words(content: bytes) -> int:
+    """Count whitespace-separated words in UTF-8 encoded text
+
+    bytes.split() only splits on ASCII whitespace, which skips str.split()'s
+    Unicode whitespace checks; non-breaking spaces no longer separate words.
+    """
+    return len(content.split())
+
+
+def extract_metadata_from_html(
+    html_path: str,
+    content: str,
+    archive_root: str,
+    processed_date: str,
+    tree: LexborHTMLParser | None = None,
+) -> DocumentMetadata:
+    """Extract metadata from HTML file
+
+    ``archive_root`` and ``processed_date`` are computed once per run by the
+    caller. Pass an already-parsed ``tree`` to avoid parsing the document twice.
+    """
+    if tree is None:
+        tree = LexborHTMLParser(content)
+
+    # Try to extract title
+    title = "Unknown"
+    title_node = tree.css_first("title")
+    h1_node = tree.css_first("h1")
+    if title_node:
+        title = title_node.text().strip() or "Unknown"
+    elif h1_node:
+        title = h1_node.text().strip()
+
+    # Try to extract author from path or content
+    author = None
+    if "/archive/" in html_path:
+        parts = html_path.split("/archive/")[-1].split("/")
+        if len(parts) > 0:
+            author = parts[0].replace("-", " ").title()
+
+    # Try to extract date
+    date = None
+    date_meta = tree.css_first('meta[name="date"]')
+    if date_meta:
+        date = date_meta.attributes.get("content")
+
+    # Construct source URL (every path found by the walk starts with the root)
+    source_url = MIA_BASE_URL + html_path[len(archive_root) :]
+
+    return DocumentMetadata(
+        source_url=source_url,
+        title=title,
+        author=author,
+        date=date,
+        language="en",
+        doc_type="html",
+        original_path=html_path,
+        processed_date=processed_date,
+    )
+
+
+def html_to_markdown(
+    html_path: str, archive_root: str, processed_date: str
+) -> tuple[bytes, DocumentMetadata] | None:
+    """Convert HTML file to UTF-8 encoded markdown with metadata"""
+    try:
+        content = Path(html_path).read_text(encoding="utf-8", errors="ignore")
+        tree = LexborHTMLParser(content)
+
+        # Extract metadata before stripping header elements
+        metadata = extract_metadata_from_html(
+            html_path, content, archive_root, processed_date, tree
+        )
+
+        # Remove script, style, nav elements
+        for element in tree.css("script, style, nav, header, footer"):
+            element.decompose()
+
+        # Convert to markdown; plain prose pages skip the markdownify round-trip
+        if tree.body is not None and tree.css_first(COMPLEX_MARKUP_SELECTOR) is None:
+            markdown_content = simple_markdown(tree.body)
+        else:
+            soup = BeautifulSoup(tree.html, "lxml", parse_only=BODY_STRAINER)
+            markdown_content = MARKDOWN_CONVERTER.convert_soup(soup)
+
+        # Clean up excessive whitespace
+        markdown_content = BLANK_LINES_RE.sub("\n\n", markdown_content)
+
+        # Calculate word count and hash; the encoded body is reused for the write
+        content_bytes = markdown_content.encode("utf-8")
+        word_count = count_words(content_bytes)
+        content_hash = hashlib.blake2b(content_bytes, digest_size=8).hexdigest()
+
+        metadata.word_count = word_count
+        metadata.content_hash = content_hash
+
+        return content_bytes, metadata
+
+    except Exception as e:
+        print(f"Error processing {html_path}: {e}")
+        return None
+
+
+def pdf_page_count(pdf_path: str) -> int:
+    """Number of pages in a PDF, or 0 if it cannot be opened"""
+    try:
+        with pymupdf.open(pdf_path) as doc:
+            return doc.page_count
+    except Exception:
+        return 0
+
+
+def pdf_header_info(pdf_path: str) -> pymupdf_rag.IdentifyHeaders | None:
+    """Heading levels by font size over a whole PDF, or None if it can't be read
+
+    Page ranges share this so a heading gets the level it would have in a
+    whole-document conversion, not one ranked among its own range's fonts.
+    """
+    try:
+        return pymupdf_rag.IdentifyHeaders(pdf_path)
+    except Exception:
+        return None
+
+
+def pdf_pages_to_markdown(
+    pdf_path: str, pages: list[int], hdr_info: pymupdf_rag.IdentifyHeaders
+) -> str | None:
+    """Convert one page range of a large PDF; the caller joins the ranges"""
+    try:
+        return pymupdf_rag.to_markdown(pdf_path, pages=pages, hdr_info=hdr_info)
+    except Exception as e:
+        print(f"Error processing {pdf_path} pages {pages[0]}-{pages[-1]}: {e}")
+        return None
+
+
+def pdf_to_markdown(
+    pdf_path: str, archive_root: str, processed_date: str, markdown_content: str | None = None
+) -> tuple[bytes, DocumentMetadata] | None:
+    """Convert PDF to UTF-8 encoded markdown using pymupdf4llm
+
+    Pass ``markdown_content`` joined from pdf_pages_to_markdown ranges to
+    skip the whole-document conversion.
+    """
+    try:
+        # Convert PDF to markdown
+        if markdown_content is None:
+            markdown_content = pymupdf_rag.to_markdown(pdf_path)
+
+        # Extract basic metadata
+        source_url = MIA_BASE_URL + pdf_path[len(archive_root) :]
+        title = Path(pdf_path).stem.replace("-", " ").title()
+
+        # Try to infer author from path
+        author = None
+        if "/archive/" in pdf_path:
+            parts = pdf_path.split("/archive/")[-1].split("/")
+            if len(parts) > 0:
+                author = parts[0].replace("-", " ").title()
+
+        content_bytes = markdown_content.encode("utf-8")
+        word_count = count_words(content_bytes)
+        content_hash = hashlib.blake2b(content_bytes, digest_size=8).hexdigest()
+
+        metadata = DocumentMetadata(
+            source_url=source_url,
+            title=title,
+            author=author,
+            language="en",
+            doc_type="pdf",
+            original_path=pdf_path,
+            processed_date=processed_date,
+            word_count=word_count,
+            content_hash=content_hash,
+        )
+
+        return content_bytes, metadata
+
+    except Exception as e:
+        print(f"Error processing {pdf_path}: {e}")
+        return None
+
+
 class MIAProcessor:
     """Process MIA archive into RAG-ready markdown"""
 
-    def __init__(self, output_dir: Path = Path("~/marxists-processed").expanduser()):
+    def __init__(
+        self,
+        output_dir: Path = Path("~/marxists-processed").expanduser(),
+        workers: int | None = None,
+        resume: bool = True,
+    ):
         self.output_dir = output_dir
+        self.workers = workers or os.cpu_count() or 1
+        self.resume = resume
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         self.metadata_dir = self.output_dir / "metadata"
@@ -63,11 +586,18 @@ class MIAProcessor:
         self.sections_data = {}
         self.periodicals_data = {}
 
+        # Source path -> [mtime_ns, size, content_hash] of already processed files
+        self.processed_index_path = self.output_dir / "processed.json"
+        self.processed_index: dict[str, list] = {}
+        self._source_signatures: dict[str, list[int]] = {}
+
         self.stats = {
             "html_processed": 0,
             "pdf_processed": 0,
             "errors": 0,
             "skipped_non_english": 0,
+            "skipped_non_english_dirs": 0,
+            "skipped_unchanged": 0,
             "total_words": 0,
         }
 
@@ -80,27 +610,38 @@ class MIAProcessor:
         }
 
         print("Downloading MIA JSON metadata...")
-        for name, url in json_urls.items():
-            try:
-                print(f"  Fetching {name}...")
-                response = requests.get(url, timeout=30)
+        with requests.Session() as session, ThreadPoolExecutor(len(json_urls)) as executor:
+            # All fetches share one connection pool; retry transient server errors
+            retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+            session.mount("https://", HTTPAdapter(max_retries=retry))
+
+            def fetch(url: str):
+                response = session.get(url, timeout=30)
                 response.raise_for_status()
+                return response.json()
 
-                data = response.json()
-                output_path = self.json_dir / f"{name}.json"
-                output_path.write_text(json.dumps(data, indent=2))
+            # Fetch all files concurrently, then write them serially
+            futures = {name: executor.submit(fetch, url) for name, url in json_urls.items()}
 
-                # Store in memory for processing
-                if name == "authors":
-                    self.authors_data = data
-                elif name == "sections":
-                    self.sections_data = data
-                elif name == "periodicals":
-                    self.periodicals_data = data
+            for name, future in futures.items():
+                try:
+                    print(f"  Fetching {name}...")
+                    data = future.result()
 
-                print(f"    ✓ Saved to {output_path}")
-            except Exception as e:
-                print(f"    ✗ Error fetching {name}: {e}")
+                    output_path = self.json_dir / f"{name}.json"
+                    output_path.write_text(json.dumps(data, indent=2))
+
+                    # Store in memory for processing
+                    if name == "authors":
+                        self.authors_data = data
+                    elif name == "sections":
+                        self.sections_data = data
+                    elif name == "periodicals":
+                        self.periodicals_data = data
+
+                    print(f"    ✓ Saved to {output_path}")
+                except Exception as e:
+                    print(f"    ✗ Error fetching {name}: {e}")
 
     def load_json_metadata(self):
         """Load previously downloaded JSON metadata"""
@@ -116,236 +657,233 @@ class MIAProcessor:
                     elif name == "periodicals":
                         self.periodicals_data = data
 
-    def is_english_content(self, path: Path) -> bool:
-        """Heuristic to detect English content based on path"""
-        path_str = str(path).lower()
-
-        # Skip non-English language directories
-        non_english_dirs = [
-            "/chinese/",
-            "/deutsch/",
-            "/espanol/",
-            "/francais/",
-            "/italiano/",
-            "/japanese/",
-            "/polski/",
-            "/portugues/",
-            "/russian/",
-            "/turkce/",
-            "/arabic/",
-            "/svenska/",
-            "/catala/",
-            "/greek/",
-            "/korean/",
-            "/farsi/",
-        ]
+    def load_processed_index(self):
+        """Load the resume index written by a previous run"""
+        if self.processed_index_path.exists():
+            self.processed_index = json.loads(self.processed_index_path.read_bytes())
 
-        for lang_dir in non_english_dirs:
-            if lang_dir in path_str:
-                return False
+    def save_processed_index(self):
+        """Persist the resume index"""
+        self.processed_index_path.write_bytes(json.dumps(self.processed_index).encode("utf-8"))
 
-        # Archive and history sections are primarily English
-        if "/archive/" in path_str or "/history/" in path_str:
-            return True
+    def is_english_content(self, path: str | Path) -> bool:
+        """Heuristic to detect English content based on path"""
+        # Skip non-English language directories; everything else (archive,
+        # history, reference, glossary, ...) is processed as English
+        return NON_ENGLISH_PATH_RE.search(str(path).lower()) is None
+
+    def find_documents(self, archive_path: Path) -> tuple[list[os.DirEntry], list[os.DirEntry]]:
+        """Walk the archive once, collecting HTML and PDF directory entries
+
+        Entries carry plain str paths and cache their stat result, so the hot
+        loops downstream never build Path objects.
+        """
+        html_files = []
+        pdf_files = []
+
+        pending_dirs = [str(archive_path)]
+        while pending_dirs:
+            with os.scandir(pending_dirs.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Prune non-English language directories instead of descending
+                        if entry.name.lower() in NON_ENGLISH_DIRS:
+                            self.stats["skipped_non_english_dirs"] += 1
+                        else:
+                            pending_dirs.append(entry.path)
+                        continue
+
+                    extension = entry.name.rsplit(".", 1)[-1].lower()
+                    if extension in ("htm", "html"):
+                        html_files.append(entry)
+                    elif extension == "pdf":
+                        pdf_files.append(entry)
+
+        return html_files, pdf_files
+
+    def _filter_english(self, entries: list[os.DirEntry]) -> list[os.DirEntry]:
+        """Drop non-English paths, counting them as skipped"""
+        english = [e for e in entries if self.is_english_content(e.path)]
+        self.stats["skipped_non_english"] += len(entries) - len(english)
+        return english
+
+    def _skip_unchanged(self, entries: list[os.DirEntry]) -> list[str]:
+        """Drop entries whose mtime and size match the resume index
+
+        Returns the paths left to convert.
+        """
+        remaining = []
+        for entry in entries:
+            st = entry.stat()
+            signature = [st.st_mtime_ns, st.st_size]
+            indexed = self.processed_index.get(entry.path)
+            if indexed and indexed[:2] == signature:
+                self.stats["skipped_unchanged"] += 1
+                continue
 
-        # Reference section is English
-        if "/reference/" in path_str or "/glossary/" in path_str:
-            return True
+            self._source_signatures[entry.path] = signature
+            remaining.append(entry.path)
+        return remaining
+
+    def _submit_pdfs(
+        self, executor: ProcessPoolExecutor, pdf_files: list[str], futures: dict
+    ) -> tuple[dict[str, list[str | None]], dict[str, int]]:
+        """Queue PDF conversions, splitting large PDFs into page ranges
+
+        Splitting keeps a few long books from leaving the other workers idle
+        at the end of the run. Heading levels are read from the whole PDF
+        here and shared by its ranges, so the joined ranges match a
+        whole-document conversion. Returns the per-PDF slots for range results
+        and the number of ranges still pending for each split PDF.
+        """
+        run_args = (self._archive_root_str, self._run_started_iso)
+        page_parts: dict[str, list[str | None]] = {}
+        pending_parts: dict[str, int] = {}
+        for p in pdf_files:
+            page_count = pdf_page_count(p)
+            hdr_info = pdf_header_info(p) if page_count > PDF_PAGES_PER_TASK else None
+            if hdr_info is None:
+                futures[executor.submit(pdf_to_markdown, p, *run_args)] = "pdf"
+                continue
 
-        return True  # Default to processing
+            starts = range(0, page_count, PDF_PAGES_PER_TASK)
+            page_parts[p] = [None] * len(starts)
+            pending_parts[p] = len(starts)
+            for index, start in enumerate(starts):
+                pages = list(range(start, min(start + PDF_PAGES_PER_TASK, page_count)))
+                future = executor.submit(pdf_pages_to_markdown, p, pages, hdr_info)
+                futures[future] = (p, index)
+
+        return page_parts, pending_parts
+
+    def _record_processed(self, metadata: DocumentMetadata):
+        """Add a saved document to the resume index, flushing periodically"""
+        path_str = metadata.original_path
+        self.processed_index[path_str] = [
+            *self._source_signatures[path_str],
+            metadata.content_hash,
+        ]
+        saved = self.stats["html_processed"] + self.stats["pdf_processed"]
+        if saved % PROCESSED_INDEX_FLUSH_EVERY == 0:
+            self.save_processed_index()
 
-    def extract_metadata_from_html(self, html_path: Path, content: str) -> DocumentMetadata:
+    def extract_metadata_from_html(
+        self, html_path: Path, content: str, tree: LexborHTMLParser | None = None
+    ) -> DocumentMetadata:
         """Extract metadata from HTML file"""
-        soup = BeautifulSoup(content, "html.parser")
-
-        # Try to extract title
-        title = "Unknown"
-        if soup.title:
-            title = soup.title.string.strip() if soup.title.string else "Unknown"
-        elif soup.h1:
-            title = soup.h1.get_text().strip()
-
-        # Try to extract author from path or content
-        author = None
-        path_str = str(html_path)
-        if "/archive/" in path_str:
-            parts = path_str.split("/archive/")[-1].split("/")
-            if len(parts) > 0:
-                author = parts[0].replace("-", " ").title()
-
-        # Try to extract date
-        date = None
-        date_meta = soup.find("meta", {"name": "date"})
-        if date_meta:
-            date = date_meta.get("content")
-
-        # Construct source URL
-        source_url = str(html_path).replace(str(self.archive_root), "https://www.marxists.org")
-
-        return DocumentMetadata(
-            source_url=source_url,
-            title=title,
-            author=author,
-            date=date,
-            language="en",
-            doc_type="html",
-            original_path=str(html_path),
-            processed_date=datetime.now().isoformat(),
+        return extract_metadata_from_html(
+            str(html_path), content, self._archive_root_str, self._run_started_iso, tree
         )
 
-    def html_to_markdown(self, html_path: Path) -> tuple[str, DocumentMetadata] | None:
+    def html_to_markdown(self, html_path: Path) -> tuple[bytes, DocumentMetadata] | None:
         """Convert HTML file to markdown with metadata"""
-        try:
-            content = html_path.read_text(encoding="utf-8", errors="ignore")
-            soup = BeautifulSoup(content, "html.parser")
-
-            # Remove script, style, nav elements
-            for element in soup(["script", "style", "nav", "header", "footer"]):
-                element.decompose()
-
-            # Extract metadata
-            metadata = self.extract_metadata_from_html(html_path, content)
-
-            # Convert to markdown
-            markdown_content = md(str(soup), heading_style="ATX")
-
-            # Clean up excessive whitespace
-            markdown_content = re.sub(r"\n\s*\n\s*\n+", "\n\n", markdown_content)
+        return html_to_markdown(str(html_path), self._archive_root_str, self._run_started_iso)
 
-            # Calculate word count and hash
-            word_count = len(markdown_content.split())
-            content_hash = hashlib.sha256(markdown_content.encode()).hexdigest()[:16]
-
-            metadata.word_count = word_count
-            metadata.content_hash = content_hash
-
-            return markdown_content, metadata
-
-        except Exception as e:
-            print(f"Error processing {html_path}: {e}")
-            return None
-
-    def pdf_to_markdown(self, pdf_path: Path) -> tuple[str, DocumentMetadata] | None:
+    def pdf_to_markdown(self, pdf_path: Path) -> tuple[bytes, DocumentMetadata] | None:
         """Convert PDF to markdown using pymupdf4llm"""
-        try:
-            # Convert PDF to markdown
-            markdown_content = pymupdf4llm.to_markdown(str(pdf_path))
-
-            # Extract basic metadata
-            source_url = str(pdf_path).replace(str(self.archive_root), "https://www.marxists.org")
-            title = pdf_path.stem.replace("-", " ").title()
-
-            # Try to infer author from path
-            author = None
-            path_str = str(pdf_path)
-            if "/archive/" in path_str:
-                parts = path_str.split("/archive/")[-1].split("/")
-                if len(parts) > 0:
-                    author = parts[0].replace("-", " ").title()
-
-            word_count = len(markdown_content.split())
-            content_hash = hashlib.sha256(markdown_content.encode()).hexdigest()[:16]
-
-            metadata = DocumentMetadata(
-                source_url=source_url,
-                title=title,
-                author=author,
-                language="en",
-                doc_type="pdf",
-                original_path=str(pdf_path),
-                processed_date=datetime.now().isoformat(),
-                word_count=word_count,
-                content_hash=content_hash,
-            )
-
-            return markdown_content, metadata
-
-        except Exception as e:
-            print(f"Error processing {pdf_path}: {e}")
-            return None
-
-    def save_document(self, content: str, metadata: DocumentMetadata):
-        """Save markdown content and metadata"""
+        return pdf_to_markdown(str(pdf_path), self._archive_root_str, self._run_started_iso)
+
+    def save_document(self, content: bytes, metadata: DocumentMetadata):
+        """Save UTF-8 encoded markdown content and metadata"""
         # Create safe filename
-        safe_title = re.sub(r"[^\w\s-]", "", metadata.title)[:100]
-        safe_title = re.sub(r"[-\s]+", "-", safe_title)
+        title = metadata.title
+        if title.isascii():
+            safe_title = title.translate(SAFE_TITLE_ASCII_TABLE)[:100]
+        else:
+            safe_title = SAFE_TITLE_STRIP_RE.sub("", title)[:100]
+        safe_title = SAFE_TITLE_JOIN_RE.sub("-", safe_title)
 
         filename = f"{safe_title}_{metadata.content_hash}"
 
         # Save markdown
         md_path = self.markdown_dir / f"{filename}.md"
 
-        # Add metadata header to markdown
-        header = f"""---
-title: {metadata.title}
-author: {metadata.author or 'Unknown'}
-source_url: {metadata.source_url}
-date: {metadata.date or 'Unknown'}
-language: {metadata.language}
-doc_type: {metadata.doc_type}
-word_count: {metadata.word_count}
-processed_date: {metadata.processed_date}
----
+        # Flat dataclass, so skip asdict()'s recursive deepcopy
+        fields = {name: getattr(metadata, name) for name in metadata.__slots__}
 
-"""
-        md_path.write_text(header + content, encoding="utf-8")
+        # Add metadata header to markdown
+        header = HEADER_TEMPLATE.format_map(
+            {
+                **fields,
+                "author": metadata.author or "Unknown",
+                "date": metadata.date or "Unknown",
+            }
+        )
+        # Write header and body separately rather than concatenating and
+        # re-encoding a copy of the whole document
+        with md_path.open("wb") as f:
+            f.write(header.encode("utf-8"))
+            f.write(content)
 
         # Save metadata JSON
         meta_path = self.metadata_dir / f"{filename}.json"
-        meta_path.write_text(json.dumps(asdict(metadata), indent=2))
+        meta_path.write_bytes(json.dumps(fields, indent=2, ensure_ascii=False).encode("utf-8"))
 
         self.stats["total_words"] += metadata.word_count
 
     def process_archive(self, archive_path: Path):
         """Process entire MIA archive directory"""
         self.archive_root = archive_path
+        # Computed once per run instead of once per document
+        self._archive_root_str = str(archive_path)
+        self._run_started_iso = datetime.now().isoformat()
         print(f"Processing archive at: {archive_path}")
         print(f"Output directory: {self.output_dir}")
 
         # Load metadata if available
         self.load_json_metadata()
 
-        # Find all HTML files
-        html_files = list(archive_path.rglob("*.htm")) + list(archive_path.rglob("*.html"))
-        pdf_files = list(archive_path.rglob("*.pdf"))
+        # Find all HTML and PDF files
+        html_files, pdf_files = self.find_documents(archive_path)
 
         print(f"\nFound {len(html_files)} HTML files and {len(pdf_files)} PDFs")
 
-        # Process HTML files
-        print("\n=== Processing HTML files ===")
-        for i, html_path in enumerate(html_files, 1):
-            if not self.is_english_content(html_path):
-                self.stats["skipped_non_english"] += 1
-                continue
-
-            if i % 100 == 0:
-                print(f"  Processed {i}/{len(html_files)} HTML files...")
-
-            result = self.html_to_markdown(html_path)
-            if result:
-                content, metadata = result
-                self.save_document(content, metadata)
-                self.stats["html_processed"] += 1
-            else:
-                self.stats["errors"] += 1
-
-        # Process PDFs
-        print("\n=== Processing PDF files ===")
-        for i, pdf_path in enumerate(pdf_files, 1):
-            if not self.is_english_content(pdf_path):
-                self.stats["skipped_non_english"] += 1
-                continue
-
-            if i % 10 == 0:
-                print(f"  Processed {i}/{len(pdf_files)} PDFs...")
-
-            result = self.pdf_to_markdown(pdf_path)
-            if result:
-                content, metadata = result
-                self.save_document(content, metadata)
-                self.stats["pdf_processed"] += 1
-            else:
-                self.stats["errors"] += 1
+        # Skip non-English content before queueing any work
+        html_files = self._filter_english(html_files)
+        pdf_files = self._filter_english(pdf_files)
+
+        # Skip files left unchanged since a previous run
+        if self.resume:
+            self.load_processed_index()
+        html_files = self._skip_unchanged(html_files)
+        pdf_files = self._skip_unchanged(pdf_files)
+
+        # Convert documents in parallel; writes stay on the main process
+        print(f"\n=== Processing documents with {self.workers} workers ===")
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            run_args = (self._archive_root_str, self._run_started_iso)
+            futures = {executor.submit(html_to_markdown, p, *run_args): "html" for p in html_files}
+            page_parts, pending_parts = self._submit_pdfs(executor, pdf_files, futures)
+
+            for i, future in enumerate(as_completed(futures), 1):
+                if i % 100 == 0:
+                    print(f"  Processed {i}/{len(futures)} tasks...")
+
+                doc_type = futures[future]
+                result = future.result()
+                if isinstance(doc_type, tuple):
+                    # Page range of a large PDF; finish it once every range is in
+                    pdf_path, index = doc_type
+                    page_parts[pdf_path][index] = result
+                    pending_parts[pdf_path] -= 1
+                    if pending_parts[pdf_path]:
+                        continue
+
+                    doc_type = "pdf"
+                    parts = page_parts.pop(pdf_path)
+                    result = None
+                    if None not in parts:
+                        result = pdf_to_markdown(pdf_path, *run_args, "".join(parts))
+
+                if result:
+                    content, metadata = result
+                    self.save_document(content, metadata)
+                    self.stats[f"{doc_type}_processed"] += 1
+                    self._record_processed(metadata)
+                else:
+                    self.stats["errors"] += 1
+
+        self.save_processed_index()
 
         self.print_stats()
         self.save_processing_report()
@@ -358,6 +896,8 @@ processed_date: {metadata.processed_date}
         print(f"HTML files processed: {self.stats['html_processed']}")
         print(f"PDF files processed: {self.stats['pdf_processed']}")
         print(f"Non-English skipped: {self.stats['skipped_non_english']}")
+        print(f"Non-English directories skipped: {self.stats['skipped_non_english_dirs']}")
+        print(f"Unchanged since last run: {self.stats['skipped_unchanged']}")
         print(f"Errors: {self.stats['errors']}")
         print(f"Total words: {self.stats['total_words']:,}")
         print(f"\nOutput directory: {self.output_dir}")
@@ -390,6 +930,12 @@ Examples:
 
   # Custom output directory
   python mia_processor.py --process-archive ~/Downloads/dump_www-marxists-org/ --output ~/my-rag-data/
+
+  # Limit conversion to 4 worker processes
+  python mia_processor.py --process-archive ~/Downloads/dump_www-marxists-org/ --workers 4
+
+  # Reprocess every file, ignoring the resume index from earlier runs
+  python mia_processor.py --process-archive ~/Downloads/dump_www-marxists-org/ --no-resume
         """,
     )
 
@@ -403,10 +949,23 @@ Examples:
         default=Path("~/marxists-processed").expanduser(),
         help="Output directory (default: ~/marxists-processed)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for document conversion (default: CPU count)",
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Reprocess files already recorded in the output's processed.json",
+    )
 
     args = parser.parse_args()
 
-    processor = MIAProcessor(output_dir=args.output)
+    processor = MIAProcessor(
+        output_dir=args.output, workers=args.workers, resume=not args.no_resume
+    )
 
     if args.download_json:
         processor.download_json_metadata()
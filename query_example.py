@@ -7,6 +7,7 @@ Test your Marxist theory RAG system with various query types.
 Usage:
     python query_example.py --db chroma --query "What is surplus value?"
     python query_example.py --db qdrant --interactive
+    python query_example.py --db qdrant --query-file queries.txt
 """
 
 import argparse
@@ -21,6 +22,10 @@ except ImportError:
     sys.exit(1)
 
 
+# ChromaDB query-time HNSW beam width; trades a little recall for latency
+HNSW_SEARCH_EF = 64
+
+
 class RAGQuery:
     """Query interface for MIA RAG system"""
 
@@ -29,6 +34,8 @@ class RAGQuery:
         self.persist_dir = persist_dir
         self.embedding_model = embedding_model
         self.db = None
+        # Keep-alive connection to Ollama shared by every embedding request
+        self.http = requests.Session()
 
         self.setup_db()
 
@@ -42,8 +49,9 @@ class RAGQuery:
                 print("Install ChromaDB: pip install chromadb --break-system-packages")
                 sys.exit(1)
 
-            self.client = chromadb.Client(
-                Settings(persist_directory=str(self.persist_dir), anonymized_telemetry=False)
+            # PersistentClient memory-maps the on-disk index written by rag_ingest.py
+            self.client = chromadb.PersistentClient(
+                path=str(self.persist_dir), settings=Settings(anonymized_telemetry=False)
             )
 
             try:
@@ -54,6 +62,15 @@ class RAGQuery:
                 print(f"Error loading collection: {e}")
                 sys.exit(1)
 
+            # rag_ingest.py sets search_ef at creation; collections built before
+            # that get it written once here rather than on every start
+            metadata = self.db.metadata or {}
+            if metadata.get("hnsw:search_ef") != HNSW_SEARCH_EF:
+                try:
+                    self.db.modify(metadata={**metadata, "hnsw:search_ef": HNSW_SEARCH_EF})
+                except Exception as e:
+                    print(f"  Could not tune HNSW search_ef: {e}")
+
         elif self.db_type == "qdrant":
             try:
                 from qdrant_client import QdrantClient
@@ -74,7 +91,7 @@ class RAGQuery:
     def get_embedding(self, text: str) -> list:
         """Get embedding from Ollama"""
         try:
-            response = requests.post(
+            response = self.http.post(
                 "http://localhost:11434/api/embeddings",
                 json={"model": self.embedding_model, "prompt": text},
                 timeout=30,
@@ -89,6 +106,24 @@ class RAGQuery:
             print(f"Error getting embedding: {e}")
             return None
 
+    def get_embeddings_batch(self, texts: list[str]) -> list | None:
+        """Get embeddings for several texts from Ollama in one request"""
+        try:
+            response = self.http.post(
+                "http://localhost:11434/api/embed",
+                json={"model": self.embedding_model, "input": texts},
+                timeout=120,
+            )
+            response.raise_for_status()
+            return response.json()["embeddings"]
+        except requests.exceptions.ConnectionError:
+            print("\n❌ Cannot connect to Ollama. Make sure it's running:")
+            print("   ollama serve")
+            sys.exit(1)
+        except Exception as e:
+            print(f"Error getting embeddings: {e}")
+            return None
+
     def query_chroma(self, query: str, n_results: int = 5):
         """Query ChromaDB"""
         results = self.db.query(query_texts=[query], n_results=n_results)
@@ -122,16 +157,75 @@ class RAGQuery:
             for result in results
         ]
 
+    def query_chroma_batch(self, queries: list[str], n_results: int = 5):
+        """Query ChromaDB with several queries in one call"""
+        results = self.db.query(query_texts=queries, n_results=n_results)
+
+        return [
+            [
+                {"content": doc, "metadata": meta, "distance": dist}
+                for doc, meta, dist in zip(docs, metas, dists, strict=False)
+            ]
+            for docs, metas, dists in zip(
+                results["documents"], results["metadatas"], results["distances"], strict=False
+            )
+        ]
+
+    def query_qdrant_batch(self, queries: list[str], n_results: int = 5):
+        """Query Qdrant with one embedding call and one search_batch round-trip"""
+        from qdrant_client.models import SearchRequest
+
+        embeddings = self.get_embeddings_batch(queries)
+        if not embeddings:
+            return [[] for _ in queries]
+
+        batch_results = self.db.search_batch(
+            collection_name="marxist_theory",
+            requests=[
+                SearchRequest(vector=embedding, limit=n_results, with_payload=True)
+                for embedding in embeddings
+            ],
+        )
+
+        return [
+            [
+                {
+                    "content": result.payload["content"],
+                    "metadata": {k: v for k, v in result.payload.items() if k != "content"},
+                    "score": result.score,
+                }
+                for result in results
+            ]
+            for results in batch_results
+        ]
+
     def query(self, query_text: str, n_results: int = 5):
         """Query the RAG system"""
-        print(f"\n🔍 Querying: {query_text}")
-        print("=" * 80)
-
         if self.db_type == "chroma":
             results = self.query_chroma(query_text, n_results)
         else:
             results = self.query_qdrant(query_text, n_results)
 
+        self.print_results(query_text, results)
+
+    def query_batch(self, queries: list[str], n_results: int = 5):
+        """Query the RAG system with a batch of queries, e.g. for evaluation runs"""
+        if not queries:
+            return
+
+        if self.db_type == "chroma":
+            batch_results = self.query_chroma_batch(queries, n_results)
+        else:
+            batch_results = self.query_qdrant_batch(queries, n_results)
+
+        for query_text, results in zip(queries, batch_results, strict=True):
+            self.print_results(query_text, results)
+
+    def print_results(self, query_text: str, results: list):
+        """Print the results for one query"""
+        print(f"\n🔍 Querying: {query_text}")
+        print("=" * 80)
+
         if not results:
             print("No results found.")
             return
@@ -165,6 +259,10 @@ class RAGQuery:
         print("  'examples' to see example queries")
         print("=" * 80 + "\n")
 
+        # Load the index before the first real query instead of during it
+        if self.db_type == "chroma":
+            self.db.query(query_texts=["warmup"], n_results=1)
+
         while True:
             try:
                 query = input("Query> ").strip()
@@ -223,6 +321,9 @@ Examples:
 
   # More results
   python query_example.py --db chroma --query "organizing tactics" --results 10
+
+  # Batch of queries, one per line
+  python query_example.py --db qdrant --query-file queries.txt
         """,
     )
 
@@ -239,6 +340,9 @@ Examples:
         help="Vector DB directory (default: ./mia_vectordb/)",
     )
     parser.add_argument("--query", type=str, help="Query string")
+    parser.add_argument(
+        "--query-file", type=Path, help="File with one query per line, run as a single batch"
+    )
     parser.add_argument("--results", type=int, default=5, help="Number of results (default: 5)")
     parser.add_argument("--interactive", action="store_true", help="Interactive query mode")
     parser.add_argument(
@@ -254,6 +358,15 @@ Examples:
         print("Have you run rag_ingest.py yet?")
         return 1
 
+    # Check the query file before connecting; blank lines are not queries
+    queries = []
+    if args.query_file and not (args.interactive or args.query):
+        lines = args.query_file.read_text(encoding="utf-8").splitlines()
+        queries = [line.strip() for line in lines if line.strip()]
+        if not queries:
+            print(f"Error: No queries found in {args.query_file}")
+            return 1
+
     # Initialize query interface
     rag = RAGQuery(
         db_type=args.db, persist_dir=args.persist_dir, embedding_model=args.embedding_model
@@ -263,6 +376,8 @@ Examples:
         rag.interactive_mode()
     elif args.query:
         rag.query(args.query, args.results)
+    elif args.query_file:
+        rag.query_batch(queries, args.results)
     else:
         parser.print_help()
         print("\n💡 Tip: Use --interactive for easier exploration")
@@ -9,7 +9,12 @@ Refactored to use the Visitor pattern for better separation of concerns
 and reduced cyclomatic complexity.
 """
 
+import mmap
+import os
+import subprocess
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import click
@@ -26,37 +31,226 @@ console = Console()
 PROJECT_ROOT = Path(__file__).parent.parent
 INTERFACES_DIR = PROJECT_ROOT / "src" / "mia_rag" / "interfaces"
 
+# Parsed interface definitions from the previous run, reused while the
+# contracts file is unchanged
+INTERFACE_CACHE_PATH = PROJECT_ROOT / ".cache" / "check_interfaces" / "contracts.pkl"
 
-def find_implementations(interface_name: str, search_dir: Path) -> list[Path]:
-    """Find files that might implement an interface.
+# Files at least this large are memory-mapped instead of copied onto the heap;
+# below it the extra mmap syscalls cost more than the copy
+MMAP_MIN_BYTES = 256 * 1024
+
+# Fewer implementation files than this are validated on the main process,
+# where pool startup would cost more than it saves
+PARALLEL_VALIDATE_MIN_FILES = 16
+
+# Per-process state of validate_files workers, filled once by _init_worker
+_WORKER_STATE: dict[str, InterfaceValidator] = {}
+
+# Violation types reported for every interface a file implements
+_RELEVANT_TYPES = frozenset({"missing_method", "missing_import", "wrong_signature"})
+
+# Directories never searched for implementations
+SKIPPED_DIRS = frozenset({".git", ".venv", "node_modules", "__pycache__"})
+
+# File contents as read by read_sources. Search them with .find(), since
+# `in` on an mmap only tests for single bytes
+Source = bytes | mmap.mmap
+
+
+def read_source(py_file: Path) -> Source:
+    """Read a file's raw contents, memory-mapping it if it is large."""
+    with py_file.open("rb") as f:
+        if py_file.stat().st_size < MMAP_MIN_BYTES:
+            return f.read()
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def iter_python_files(root: Path) -> Iterator[Path]:
+    """Walk a directory tree for Python files with os.scandir.
+
+    Directory entries carry their file type, so no extra stat is needed per
+    entry, and SKIPPED_DIRS are pruned instead of descended into.
+
+    Args:
+        root: Directory to search in
+
+    Yields:
+        Python files under root
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIPPED_DIRS:
+                            stack.append(directory / entry.name)
+                    elif entry.name.endswith(".py"):
+                        yield directory / entry.name
+        except OSError:
+            # Skip directories we can't list
+            continue
+
+
+def git_python_files(search_dir: Path) -> list[Path] | None:
+    """List the Python files git knows about under a directory.
+
+    Covers tracked files and untracked ones that aren't ignored, so new
+    implementations are still checked while ignored trees (virtualenvs,
+    caches) are never walked.
 
     Args:
-        interface_name: Name of the interface to search for
         search_dir: Directory to search in
 
     Returns:
-        List of Python files that reference the interface
+        List of Python files, or None if git isn't available
+    """
+    try:
+        listed = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard", "--", "*.py"],
+            cwd=search_dir,
+            capture_output=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    # Sorted so reports list files in a stable order
+    return [search_dir / os.fsdecode(name) for name in sorted(set(listed.split(b"\0"))) if name]
+
+
+def read_sources(search_dir: Path, candidate_paths: list[Path] | None = None) -> dict[Path, Source]:
+    """Read every file that could implement an interface, once per run.
+
+    Args:
+        search_dir: Directory to search in
+        candidate_paths: Python files to consider (see git_python_files);
+            search_dir is walked with iter_python_files when not given
+
+    Returns:
+        Mapping of Python file to its raw contents, skipping interface
+        definitions and files that can't be read
     """
-    implementations = []
+    sources = {}
+
+    if candidate_paths is None:
+        candidate_paths = iter_python_files(search_dir)
 
-    for py_file in search_dir.rglob("*.py"):
+    for py_file in candidate_paths:
         # Skip interface definitions themselves
         if py_file.parent.name == "interfaces":
             continue
 
         try:
-            with open(py_file) as f:
-                content = f.read()
-                # Simple heuristic: look for class that inherits from interface
-                if interface_name in content and "class " in content:
-                    implementations.append(py_file)
-        except Exception:
+            sources[py_file] = read_source(py_file)
+        except (OSError, ValueError):
             # Skip files we can't read
-            pass
+            continue
+
+    return sources
+
+
+def find_implementations(
+    interface_name: str, search_dir: Path, sources: dict[Path, Source] | None = None
+) -> list[Path]:
+    """Find files that might implement an interface.
+
+    Args:
+        interface_name: Name of the interface to search for
+        search_dir: Directory to search in
+        sources: Contents from read_sources, shared across interfaces so
+            each file is read once rather than once per interface
+
+    Returns:
+        List of Python files that reference the interface
+    """
+    if sources is None:
+        sources = read_sources(search_dir)
+
+    return index_implementations([interface_name], sources)[interface_name]
+
+
+def index_implementations(
+    interface_names: list[str], sources: dict[Path, Source]
+) -> dict[str, list[Path]]:
+    """Find the candidate implementation files of every interface in one walk.
+
+    Args:
+        interface_names: Names of the interfaces to search for
+        sources: Contents from read_sources
+
+    Returns:
+        Mapping of interface name to the files that reference it
+    """
+    names = [(name, name.encode()) for name in interface_names]
+    implementations: dict[str, list[Path]] = {name: [] for name in interface_names}
+
+    for py_file, content in sources.items():
+        # Simple heuristic: look for class that inherits from interface
+        if content.find(b"class ") == -1:
+            continue
+
+        for name, encoded in names:
+            if content.find(encoded) != -1:
+                implementations[name].append(py_file)
 
     return implementations
 
 
+def _as_bytes(content: Source | None) -> bytes | None:
+    """Copy a memory-mapped source into bytes, which ast.parse requires."""
+    if isinstance(content, mmap.mmap):
+        return content[:]
+    return content
+
+
+def _init_worker(contracts_path: Path) -> None:
+    """Load the interface definitions once per validate_files worker."""
+    repository = InterfaceRepository(contracts_path)
+    repository.load()
+    _WORKER_STATE["validator"] = InterfaceValidator(repository)
+
+
+def _validate_file(impl_file: Path) -> list[InterfaceViolation]:
+    """Validate one file with the worker's validator."""
+    return _WORKER_STATE["validator"].validate(impl_file)
+
+
+def validate_files(
+    impl_files: list[Path],
+    validator: InterfaceValidator,
+    sources: dict[Path, Source] | None = None,
+) -> dict[Path, list[InterfaceViolation]]:
+    """Validate each implementation file once, across processes if worthwhile.
+
+    Args:
+        impl_files: Implementation files to validate
+        validator: InterfaceValidator instance
+        sources: Pre-read file contents (see read_sources); files found here
+            are parsed from memory instead of being read again
+
+    Returns:
+        Mapping of file to its violations, for every interface it implements
+    """
+    workers = os.cpu_count() or 1
+    if workers == 1 or len(impl_files) < PARALLEL_VALIDATE_MIN_FILES:
+        sources = sources or {}
+        return {
+            impl_file: validator.validate(impl_file, source=_as_bytes(sources.get(impl_file)))
+            for impl_file in impl_files
+        }
+
+    # Workers load the interface definitions themselves instead of having the
+    # repository pickled into every task
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(validator.repository.contracts_path,),
+    ) as executor:
+        return dict(zip(impl_files, executor.map(_validate_file, impl_files), strict=True))
+
+
 def display_interfaces_table(interfaces: dict) -> None:
     """Display a table of found interfaces.
 
@@ -85,10 +279,13 @@ def display_violations(violations: list[InterfaceViolation], impl_file: Path) ->
         violations: List of violations
         impl_file: Path to the implementation file
     """
-    console.print(f"  [red]❌ {impl_file.relative_to(PROJECT_ROOT)}[/red]")
+    lines = [f"  [red]❌ {impl_file.relative_to(PROJECT_ROOT)}[/red]"]
     for violation in violations:
         severity_color = "red" if violation.severity == "error" else "yellow"
-        console.print(f"    [{severity_color}]• {violation.message}[/{severity_color}]")
+        lines.append(f"    [{severity_color}]• {violation.message}[/{severity_color}]")
+
+    # One print call renders and writes the whole block
+    console.print(*lines, sep="\n")
 
 
 def check_implementations_for_interface(
@@ -97,6 +294,11 @@ def check_implementations_for_interface(
     search_dir: Path,
     validator: InterfaceValidator,
     show_fixes: bool = False,
+    *,
+    sources: dict[Path, Source] | None = None,
+    impl_files: list[Path] | None = None,
+    file_violations: dict[Path, list[InterfaceViolation]] | None = None,
+    reported: set[InterfaceViolation] | None = None,
 ) -> int:
     """Check all implementations of a specific interface.
 
@@ -106,6 +308,13 @@ def check_implementations_for_interface(
         search_dir: Directory to search for implementations
         validator: InterfaceValidator instance
         show_fixes: Whether to show suggested fixes
+        sources: Pre-read file contents (see read_sources)
+        impl_files: Candidate implementation files, if already indexed
+            (see index_implementations)
+        file_violations: Violations of already validated files
+            (see validate_files)
+        reported: Violations already counted for other interfaces; those
+            found here are added to it, and only new ones are counted
 
     Returns:
         Number of violations found
@@ -113,7 +322,8 @@ def check_implementations_for_interface(
     console.print(f"\n[cyan]Checking {interface_name}...[/cyan]")
 
     # Find potential implementations
-    impl_files = find_implementations(interface_name, search_dir)
+    if impl_files is None:
+        impl_files = find_implementations(interface_name, search_dir, sources)
 
     if not impl_files:
         console.print("  [yellow]No implementations found[/yellow]")
@@ -122,20 +332,32 @@ def check_implementations_for_interface(
     total_violations = 0
 
     for impl_file in impl_files:
-        violations = validator.validate(impl_file)
+        if file_violations is not None and impl_file in file_violations:
+            violations = file_violations[impl_file]
+        else:
+            violations = validator.validate(
+                impl_file, source=_as_bytes(sources.get(impl_file)) if sources else None
+            )
 
         # Filter violations to only those related to this interface
         # (in case file implements multiple interfaces)
         relevant_violations = [
-            v for v in violations
-            if interface_name in str(v.message) or v.violation_type in [
-                "missing_method", "missing_import", "wrong_signature"
-            ]
+            v
+            for v in violations
+            if v.violation_type in _RELEVANT_TYPES or interface_name in v.message
         ]
 
         if relevant_violations:
             display_violations(relevant_violations, impl_file)
-            total_violations += len(relevant_violations)
+
+            # A file checked for several interfaces shows its missing methods
+            # under each of them, but they only count once
+            if reported is None:
+                total_violations += len(relevant_violations)
+            else:
+                new_violations = set(relevant_violations) - reported
+                total_violations += len(new_violations)
+                reported.update(new_violations)
 
             if show_fixes:
                 console.print(
@@ -153,7 +375,8 @@ def check_implementations_for_interface(
 @click.option("--interface", help="Check specific interface")
 @click.option("--fix", is_flag=True, help="Suggest fixes for violations")
 @click.option("--strict", is_flag=True, help="Enable strict type checking")
-def main(check_all: bool, interface: str | None, fix: bool, strict: bool):
+@click.option("--no-cache", is_flag=True, help="Re-parse interface contracts instead of caching")
+def main(check_all: bool, interface: str | None, fix: bool, strict: bool, no_cache: bool):
     """Check that interface contracts are properly implemented.
 
     This tool validates that all classes implementing interfaces
@@ -168,7 +391,10 @@ def main(check_all: bool, interface: str | None, fix: bool, strict: bool):
 
     # Initialize repository and validator
     repository = InterfaceRepository()
-    repository.load()
+    if no_cache:
+        repository.load()
+    else:
+        repository.load_cached(INTERFACE_CACHE_PATH)
 
     all_interfaces = repository.get_all_interfaces()
 
@@ -185,18 +411,32 @@ def main(check_all: bool, interface: str | None, fix: bool, strict: bool):
     # Check implementations
     total_violations = 0
     src_dir = PROJECT_ROOT / "src" / "mia_rag"
-
-    for interface_name, interface_def in all_interfaces.items():
-        # Skip if checking specific interface and this isn't it
-        if interface and interface != interface_name:
-            continue
-
+    sources = read_sources(src_dir, git_python_files(src_dir))
+
+    # Skip other interfaces if checking a specific one
+    selected = {
+        name: definition
+        for name, definition in all_interfaces.items()
+        if not interface or interface == name
+    }
+    implementations = index_implementations(list(selected), sources)
+
+    # Validate each file once, even if it implements several interfaces
+    impl_files = list(dict.fromkeys(f for files in implementations.values() for f in files))
+    file_violations = validate_files(impl_files, validator, sources)
+    reported: set[InterfaceViolation] = set()
+
+    for interface_name, interface_def in selected.items():
         violations = check_implementations_for_interface(
             interface_name,
             interface_def,
             src_dir,
             validator,
             show_fixes=fix,
+            sources=sources,
+            impl_files=implementations[interface_name],
+            file_violations=file_violations,
+            reported=reported,
         )
         total_violations += violations
 
@@ -1,10 +1,29 @@
 """Domain models for boundary checking."""
 
+import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass(frozen=True)
+# Project-level config files; a path containing any of these is config
+CONFIG_FILE_PATTERNS = (
+    ".github/",
+    "pyproject.toml",
+    "poetry.lock",
+    ".gitignore",
+    ".pre-commit-config.yaml",
+    ".instance",
+    "mise.toml",
+    "README.md",
+    "LICENSE",
+)
+
+# All patterns in one alternation, so a path is scanned once
+_CONFIG_FILE_RE = re.compile("|".join(map(re.escape, CONFIG_FILE_PATTERNS)))
+
+
+@dataclass(frozen=True, slots=True)
 class FilePath:
     """Value object representing a file path with boundary metadata."""
 
@@ -36,10 +55,11 @@ class FilePath:
         Returns:
             FilePath value object
         """
-        # Convert to Path and make absolute
+        # Convert to Path and make absolute; normalizing ".." lexically avoids
+        # the stat per path component that resolve() would cost
         path_obj = Path(path)
         if not path_obj.is_absolute():
-            path_obj = (project_root / path_obj).resolve()
+            path_obj = Path(os.path.abspath(project_root / path_obj))  # noqa: PTH100
 
         # Make relative to project
         try:
@@ -71,21 +91,10 @@ class FilePath:
     @staticmethod
     def _is_config_file(path_str: str) -> bool:
         """Check if file is a project-level config file."""
-        config_patterns = [
-            ".github/",
-            "pyproject.toml",
-            "poetry.lock",
-            ".gitignore",
-            ".pre-commit-config.yaml",
-            ".instance",
-            "mise.toml",
-            "README.md",
-            "LICENSE",
-        ]
-        return any(pattern in path_str or path_str == pattern for pattern in config_patterns)
-
-
-@dataclass(frozen=True)
+        return _CONFIG_FILE_RE.search(path_str) is not None
+
+
+@dataclass(frozen=True, slots=True)
 class BoundaryViolation:
     """Value object representing a boundary violation."""
 
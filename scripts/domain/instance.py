@@ -1,10 +1,55 @@
 """Domain models for instance management."""
 
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 
 
-@dataclass(frozen=True)
+def paths_exist(paths: list[str]) -> dict[str, bool]:
+    """
+    Check which paths exist, listing each parent directory once.
+
+    Equivalent to Path(path).exists() for every path, but paths sharing a
+    parent cost one os.scandir of it instead of one stat each.
+
+    Args:
+        paths: Paths to check
+
+    Returns:
+        Dictionary mapping each path to whether it exists
+    """
+    existing: dict[str, bool] = {}
+    by_parent: dict[Path, list[tuple[str, str]]] = {}
+
+    for path in paths:
+        path_obj = Path(path)
+        if path_obj.name in ("", ".."):
+            # Roots, "." and ".." have no entry of their own in a listing
+            existing[path] = path_obj.exists()
+        else:
+            by_parent.setdefault(path_obj.parent, []).append((path, path_obj.name))
+
+    for parent, children in by_parent.items():
+        try:
+            with os.scandir(parent) as it:
+                entries = {entry.name: entry for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            entries = {}
+        except OSError:
+            # Unreadable parent; its children may still be reachable
+            for path, _ in children:
+                existing[path] = Path(path).exists()
+            continue
+
+        for path, name in children:
+            entry = entries.get(name)
+            # A symlink only exists if its target does
+            existing[path] = entry is not None and (not entry.is_symlink() or Path(path).exists())
+
+    return {path: existing[path] for path in paths}
+
+
+@dataclass(frozen=True, slots=True)
 class InstanceInfo:
     """Value object representing instance metadata and ownership."""
 
@@ -13,6 +58,11 @@ class InstanceInfo:
     directories: list[str]
     description: str = ""
     metadata: dict = field(default_factory=dict)
+    # directories as a tuple, so owns_path is a single str.startswith call
+    _dir_prefixes: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_dir_prefixes", tuple(self.directories))
 
     @classmethod
     def from_mappings(
@@ -51,29 +101,32 @@ class InstanceInfo:
 
     def owns_path(self, path: str) -> bool:
         """Check if this instance owns the given path."""
-        return any(path.startswith(directory) for directory in self.directories)
+        return path.startswith(self._dir_prefixes)
 
     def exists_on_filesystem(self) -> dict[str, bool]:
         """Check which directories exist on the filesystem."""
-        return {directory: Path(directory).exists() for directory in self.directories}
+        return paths_exist(self.directories)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SharedResource:
     """Value object representing shared resources that require coordination."""
 
     category: str
     paths: list[str]
+    # paths as a tuple, so contains_path is a single str.startswith call
+    _path_prefixes: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_path_prefixes", tuple(self.paths))
 
     def contains_path(self, path: str) -> bool:
         """Check if the given path is in this shared resource."""
-        return any(
-            path.startswith(shared_path) or path == shared_path
-            for shared_path in self.paths
-        )
+        # A path equal to a shared path also starts with it
+        return path.startswith(self._path_prefixes)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OwnershipInfo:
     """Value object representing file ownership information."""
 
@@ -100,30 +153,69 @@ class OwnershipInfo:
         Returns:
             OwnershipInfo value object
         """
-        # Check if path is shared
+        return OwnershipIndex(instances, shared_resources).lookup(path)
+
+
+class OwnershipIndex:
+    """Prefix index for looking up the ownership of many paths.
+
+    Equivalent to OwnershipInfo.for_path, but built once: each lookup then
+    costs one dict probe per distinct prefix length, instead of a startswith
+    test per directory of every instance and shared resource.
+    """
+
+    def __init__(self, instances: list[InstanceInfo], shared_resources: list[SharedResource]):
+        """
+        Index the directories of instances and paths of shared resources.
+
+        Args:
+            instances: List of all instances
+            shared_resources: List of shared resources
+        """
+        # Prefix -> (rank, owner). Shared resources outrank every instance and
+        # earlier instances outrank later ones, as in a linear scan; inserting
+        # in rank order lets setdefault keep the winner of duplicate prefixes
+        self._owners: dict[str, tuple[int, str]] = {}
         for resource in shared_resources:
-            if resource.contains_path(path):
-                return cls(
-                    path=path,
-                    owner="shared",
-                    is_shared=True,
-                    requires_coordination=True,
-                )
-
-        # Check instance ownership
-        for instance in instances:
-            if instance.owns_path(path):
-                return cls(
-                    path=path,
-                    owner=instance.name,
-                    is_shared=False,
-                    requires_coordination=False,
-                )
-
-        # No owner found
-        return cls(
+            for shared_path in resource.paths:
+                self._owners.setdefault(shared_path, (0, "shared"))
+        for rank, instance in enumerate(instances, 1):
+            for directory in instance.directories:
+                self._owners.setdefault(directory, (rank, instance.name))
+
+        self._prefix_lengths = sorted({len(prefix) for prefix in self._owners})
+
+    def lookup(self, path: str) -> OwnershipInfo:
+        """
+        Determine ownership information for a path.
+
+        Args:
+            path: File path to check
+
+        Returns:
+            OwnershipInfo value object
+        """
+        best = None
+        for length in self._prefix_lengths:
+            if length > len(path):
+                break
+            entry = self._owners.get(path[:length])
+            if entry is not None and (best is None or entry[0] < best[0]):
+                best = entry
+
+        if best is None:
+            # No owner found
+            return OwnershipInfo(
+                path=path,
+                owner=None,
+                is_shared=False,
+                requires_coordination=False,
+            )
+
+        is_shared = best[0] == 0
+        return OwnershipInfo(
             path=path,
-            owner=None,
-            is_shared=False,
-            requires_coordination=False,
+            owner=best[1],
+            is_shared=is_shared,
+            requires_coordination=is_shared,
         )
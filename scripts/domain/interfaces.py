@@ -6,11 +6,12 @@ interface contract validation process.
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Literal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InterfaceViolation:
     """Represents a violation of an interface contract.
 
@@ -70,7 +71,16 @@ class InterfaceDefinition:
         Returns:
             Just the method name part
         """
-        return signature.split("(")[0]
+        return signature.split("(", 1)[0]
+
+    @cached_property
+    def all_method_names(self) -> frozenset[str]:
+        """Names of all required methods (without signatures), computed once.
+
+        Interface definitions aren't changed after loading; the cache would
+        go stale if ``methods`` were modified after first access.
+        """
+        return frozenset(self.get_method_name(sig) for sig in self.methods)
 
     def get_all_method_names(self) -> set[str]:
         """Get set of all method names (without signatures).
@@ -78,7 +88,7 @@ class InterfaceDefinition:
         Returns:
             Set of method names required by this interface
         """
-        return {self.get_method_name(sig) for sig in self.methods}
+        return set(self.all_method_names)
 
 
 @dataclass
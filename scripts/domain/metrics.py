@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TestMetrics:
     """Immutable value object for test metrics."""
 
@@ -42,7 +42,7 @@ class TestMetrics:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CoverageMetrics:
     """Immutable value object for coverage metrics."""
 
@@ -10,7 +10,7 @@ from pathlib import Path
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstanceConfig:
     """Configuration for a specific instance.
 
@@ -29,7 +29,7 @@ class InstanceConfig:
     dependencies: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class DiagnosticResult:
     """Results from running diagnostics on an instance.
 
@@ -58,7 +58,7 @@ class DiagnosticResult:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundaryCheckResult:
     """Results from checking instance boundary violations.
 
@@ -77,7 +77,7 @@ class BoundaryCheckResult:
     errors: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ActivityReport:
     """Results from analyzing instance activity.
 
@@ -98,7 +98,7 @@ class ActivityReport:
     errors: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthCheckResult:
     """Results from health check operations.
 
@@ -121,7 +121,7 @@ class HealthCheckResult:
     errors: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RecoveryContext:
     """Context information for recovery operations.
 
@@ -1,11 +1,34 @@
 #!/usr/bin/env python3
 """Extract release notes for a specific version from CHANGELOG.md."""
 
+import mmap
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
+# Start of the next version section, which ends the current one. Changelog
+# patterns are bytes, since the changelog is searched memory-mapped
+_NEXT_VERSION_RE = re.compile(rb"\n##\s+\[")
+
+# Start of the link definitions at the end of the changelog
+_LINKS_RE = re.compile(rb"\n\[Unreleased\]:")
+
+
+@lru_cache(maxsize=64)
+def _patterns_for(version: str, binary: bool = True) -> tuple[re.Pattern, re.Pattern]:
+    """Compile the header and release date patterns for a version."""
+    escaped = re.escape(version)
+    # Matches: ## [0.2.0] - 2025-11-08 - "Title"
+    # Or: ## [0.2.0] - 2025-11-08
+    header = rf"##\s+\[{escaped}\][^\n]*\n"
+    date = rf"##\s+\[{escaped}\]\s+-\s+(\d{{4}}-\d{{2}}-\d{{2}})"
+    if binary:
+        return re.compile(header.encode()), re.compile(date.encode())
+    return re.compile(header), re.compile(date)
+
+
 def extract_release_notes(version: str, changelog_path: Path = Path("CHANGELOG.md")) -> str:
     """
     Extract release notes for a specific version from CHANGELOG.md.
@@ -20,43 +43,46 @@ def extract_release_notes(version: str, changelog_path: Path = Path("CHANGELOG.m
     if not changelog_path.exists():
         return f"No changelog found at {changelog_path}"
 
-    content = changelog_path.read_text()
-
-    # Pattern to match version header
-    # Matches: ## [0.2.0] - 2025-11-08 - "Title"
-    # Or: ## [0.2.0] - 2025-11-08
-    version_pattern = rf"##\s+\[{re.escape(version)}\].*?\n"
-
-    # Find the version section
-    match = re.search(version_pattern, content)
-    if not match:
+    # An empty file can't be mapped, and has no versions anyway
+    if changelog_path.stat().st_size == 0:
         return f"Version {version} not found in changelog"
 
-    # Extract from this version to the next version or end of file
-    start = match.end()
-
-    # Find next version header or end
-    next_version_pattern = r"\n##\s+\["
-    next_match = re.search(next_version_pattern, content[start:])
-
-    if next_match:
-        end = start + next_match.start()
-        notes = content[start:end].strip()
-    else:
-        # Find the links section at the end
-        links_pattern = r"\n\[Unreleased\]:"
-        links_match = re.search(links_pattern, content[start:])
-        if links_match:
-            end = start + links_match.start()
-            notes = content[start:end].strip()
+    # Map the changelog rather than reading it; only the section asked for is
+    # decoded
+    with (
+        changelog_path.open("rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content,
+    ):
+        # Find the version section
+        header_re, date_re = _patterns_for(version)
+        match = header_re.search(content)
+        if not match:
+            return f"Version {version} not found in changelog"
+
+        # Extract from this version to the next version or end of file
+        start = match.end()
+
+        # Find next version header or end; searching from start, rather
+        # than in content[start:], avoids copying the rest of the changelog
+        next_match = _NEXT_VERSION_RE.search(content, start)
+
+        if next_match:
+            end = next_match.start()
         else:
-            notes = content[start:].strip()
+            # Find the links section at the end
+            links_match = _LINKS_RE.search(content, start)
+            end = links_match.start() if links_match else len(content)
+        # Translate CRLF line endings, as a text-mode read would
+        notes = content[start:end].decode("utf-8").replace("\r\n", "\n").strip()
+
+        date_match = date_re.search(content)
+        release_date = date_match.group(1).decode("ascii") if date_match else "Unknown"
 
     # Add header
     header = f"# Release v{version}\n\n"
 
     # Add release metadata
-    metadata = f"**Release Date:** {get_release_date(content, version)}\n"
+    metadata = f"**Release Date:** {release_date}\n"
     metadata += f"**Git Tag:** v{version}\n\n"
 
     return header + metadata + notes
@@ -64,8 +90,8 @@ def extract_release_notes(version: str, changelog_path: Path = Path("CHANGELOG.m
 
 def get_release_date(content: str, version: str) -> str:
     """Extract release date from changelog."""
-    pattern = rf"##\s+\[{re.escape(version)}\]\s+-\s+(\d{{4}}-\d{{2}}-\d{{2}})"
-    match = re.search(pattern, content)
+    _, date_re = _patterns_for(version, binary=False)
+    match = date_re.search(content)
     if match:
         return match.group(1)
     return "Unknown"
@@ -5,7 +5,9 @@ Generate Integration Test Report for MIA RAG System
 Processes test results and creates a comprehensive integration report.
 """
 
+import os
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import click
@@ -17,17 +19,84 @@ from scripts.patterns.builders import create_integration_report
 
 console = Console()
 
+# Smaller coverage reports are parsed on the main process, where starting a
+# worker would cost more than overlapping the two parses saves
+PARALLEL_PARSE_MIN_BYTES = 1024 * 1024
 
-def parse_junit_xml(junit_file: str) -> dict:
-    """Parse JUnit XML test results."""
-    try:
-        tree = ET.parse(junit_file)
-        root = tree.getroot()
 
-        # Extract test suite information
-        testsuite = root if root.tag == "testsuite" else root.find("testsuite")
+def parse_junit_xml(junit_file: str) -> dict:
+    """Parse JUnit XML test results.
 
-        if not testsuite:
+    The file is streamed with iterparse and elements are dropped once read,
+    so memory stays flat however large the report is.
+    """
+    try:
+        testsuite = None
+        results = None
+        suite_depth = 0  # Depth of the test suite's children while it's open
+        suite_has_children = False
+        parents = []
+
+        for event, elem in ET.iterparse(junit_file, events=("start", "end")):
+            if event == "start":
+                # Extract test suite information: the root, or else its first
+                # testsuite child (attributes are complete on "start")
+                if testsuite is None and elem.tag == "testsuite" and len(parents) <= 1:
+                    testsuite = elem
+                    suite_depth = len(parents) + 1
+                    results = {
+                        "tests": int(elem.get("tests", 0)),
+                        "failures": int(elem.get("failures", 0)),
+                        "errors": int(elem.get("errors", 0)),
+                        "skipped": int(elem.get("skipped", 0)),
+                        "time": float(elem.get("time", 0.0)),
+                        "test_cases": [],
+                    }
+                elif suite_depth and len(parents) == suite_depth:
+                    suite_has_children = True
+
+                parents.append(elem)
+                continue
+
+            parents.pop()
+            if elem is testsuite:
+                suite_depth = 0
+
+            # Extract individual test cases once their children are parsed
+            if elem.tag == "testcase" and suite_depth and len(parents) >= suite_depth:
+                case_info = {
+                    "name": elem.get("name"),
+                    "classname": elem.get("classname"),
+                    "time": float(elem.get("time", 0.0)),
+                    "status": "passed",
+                }
+
+                # Check for failures
+                failure = elem.find("failure")
+                if failure is not None:
+                    case_info["status"] = "failed"
+                    case_info["failure_message"] = failure.get("message", "")
+                    case_info["failure_type"] = failure.get("type", "")
+
+                # Check for errors
+                error = elem.find("error")
+                if error is not None:
+                    case_info["status"] = "error"
+                    case_info["error_message"] = error.get("message", "")
+                    case_info["error_type"] = error.get("type", "")
+
+                # Check if skipped
+                if elem.find("skipped") is not None:
+                    case_info["status"] = "skipped"
+
+                results["test_cases"].append(case_info)
+
+            # Drop finished elements; a test case keeps its children until
+            # it has been read itself
+            if parents and parents[-1].tag != "testcase":
+                parents[-1].remove(elem)
+
+        if not suite_has_children:
             return {
                 "tests": 0,
                 "failures": 0,
@@ -37,44 +106,6 @@ def parse_junit_xml(junit_file: str) -> dict:
                 "test_cases": [],
             }
 
-        results = {
-            "tests": int(testsuite.get("tests", 0)),
-            "failures": int(testsuite.get("failures", 0)),
-            "errors": int(testsuite.get("errors", 0)),
-            "skipped": int(testsuite.get("skipped", 0)),
-            "time": float(testsuite.get("time", 0.0)),
-            "test_cases": [],
-        }
-
-        # Extract individual test cases
-        for testcase in testsuite.findall(".//testcase"):
-            case_info = {
-                "name": testcase.get("name"),
-                "classname": testcase.get("classname"),
-                "time": float(testcase.get("time", 0.0)),
-                "status": "passed",
-            }
-
-            # Check for failures
-            failure = testcase.find("failure")
-            if failure is not None:
-                case_info["status"] = "failed"
-                case_info["failure_message"] = failure.get("message", "")
-                case_info["failure_type"] = failure.get("type", "")
-
-            # Check for errors
-            error = testcase.find("error")
-            if error is not None:
-                case_info["status"] = "error"
-                case_info["error_message"] = error.get("message", "")
-                case_info["error_type"] = error.get("type", "")
-
-            # Check if skipped
-            if testcase.find("skipped") is not None:
-                case_info["status"] = "skipped"
-
-            results["test_cases"].append(case_info)
-
         return results
 
     except Exception as e:
@@ -83,28 +114,41 @@ def parse_junit_xml(junit_file: str) -> dict:
 
 
 def parse_coverage_xml(coverage_file: str) -> dict:
-    """Parse coverage XML report."""
-    try:
-        tree = ET.parse(coverage_file)
-        root = tree.getroot()
-
-        # Extract overall coverage
-        coverage_data = {
-            "line_rate": float(root.get("line-rate", 0.0)),
-            "branch_rate": float(root.get("branch-rate", 0.0)),
-            "lines_covered": int(root.get("lines-covered", 0)),
-            "lines_valid": int(root.get("lines-valid", 0)),
-            "packages": [],
-        }
+    """Parse coverage XML report.
 
-        # Extract package-level coverage
-        for package in root.findall(".//package"):
-            pkg_info = {
-                "name": package.get("name"),
-                "line_rate": float(package.get("line-rate", 0.0)),
-                "branch_rate": float(package.get("branch-rate", 0.0)),
-            }
-            coverage_data["packages"].append(pkg_info)
+    Like parse_junit_xml, the file is streamed rather than loaded whole.
+    """
+    try:
+        coverage_data = None
+        parents = []
+
+        for event, elem in ET.iterparse(coverage_file, events=("start", "end")):
+            if event == "end":
+                parents.pop()
+                # Drop finished elements; only attributes are read
+                if parents:
+                    parents[-1].remove(elem)
+                continue
+
+            if coverage_data is None:
+                # Extract overall coverage
+                coverage_data = {
+                    "line_rate": float(elem.get("line-rate", 0.0)),
+                    "branch_rate": float(elem.get("branch-rate", 0.0)),
+                    "lines_covered": int(elem.get("lines-covered", 0)),
+                    "lines_valid": int(elem.get("lines-valid", 0)),
+                    "packages": [],
+                }
+            elif elem.tag == "package":
+                # Extract package-level coverage
+                pkg_info = {
+                    "name": elem.get("name"),
+                    "line_rate": float(elem.get("line-rate", 0.0)),
+                    "branch_rate": float(elem.get("branch-rate", 0.0)),
+                }
+                coverage_data["packages"].append(pkg_info)
+
+            parents.append(elem)
 
         return coverage_data
 
@@ -119,6 +163,35 @@ def parse_coverage_xml(coverage_file: str) -> dict:
         }
 
 
+def parse_reports(junit_file: str, coverage_file: str | None) -> tuple[dict, dict | None]:
+    """Parse the JUnit results and, if given, the coverage report.
+
+    A large coverage report is parsed in a worker process while the JUnit
+    results are parsed on this one; only its small summary is sent back.
+    """
+    if not coverage_file:
+        console.print("Parsing JUnit results...")
+        return parse_junit_xml(junit_file), None
+
+    try:
+        coverage_size = Path(coverage_file).stat().st_size
+    except OSError:
+        # parse_coverage_xml reports the error
+        coverage_size = 0
+
+    if (os.cpu_count() or 1) == 1 or coverage_size < PARALLEL_PARSE_MIN_BYTES:
+        console.print("Parsing JUnit results...")
+        junit_results = parse_junit_xml(junit_file)
+        console.print("Parsing coverage data...")
+        return junit_results, parse_coverage_xml(coverage_file)
+
+    console.print("Parsing JUnit results and coverage data...")
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        coverage_future = executor.submit(parse_coverage_xml, coverage_file)
+        junit_results = parse_junit_xml(junit_file)
+        return junit_results, coverage_future.result()
+
+
 def generate_markdown_report(
     junit_results: dict, coverage_data: dict | None, merge_report: str | None
 ) -> str:
@@ -137,15 +210,8 @@ def main(junit, coverage, merge_report, output, console_output):
 
     console.print(Panel.fit("[bold cyan]Generating Integration Report[/bold cyan]"))
 
-    # Parse JUnit results
-    console.print("Parsing JUnit results...")
-    junit_results = parse_junit_xml(junit)
-
-    # Parse coverage if provided
-    coverage_data = None
-    if coverage:
-        console.print("Parsing coverage data...")
-        coverage_data = parse_coverage_xml(coverage)
+    # Parse JUnit results, and coverage if provided
+    junit_results, coverage_data = parse_reports(junit, coverage)
 
     # Generate report
     console.print("Generating report...")
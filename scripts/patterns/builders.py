@@ -1,11 +1,53 @@
 """Builder pattern for generating markdown reports."""
 
+import re
 from abc import ABC, abstractmethod
 from datetime import datetime
 
 from scripts.domain.metrics import CoverageMetrics, TestMetrics
 
 
+# Instance mentioned in a test's class or test name
+_INSTANCE_RE = re.compile(r"instance([1-6])")
+
+
+def partition_test_cases(
+    test_cases: list[dict],
+) -> tuple[list[dict], list[dict], dict[str, dict]]:
+    """Split test cases for the report sections in a single pass.
+
+    Returns:
+        (failed tests, error tests, stats per instance)
+    """
+    failed_tests = []
+    error_tests = []
+    instance_tests = {}
+    for test in test_cases:
+        status = test["status"]
+        if status == "failed":
+            failed_tests.append(test)
+        elif status == "error":
+            error_tests.append(test)
+
+        # One search over both names; a test mentioning several instances
+        # counts towards the lowest-numbered one
+        haystack = f"{test['classname'].lower()}\0{test['name'].lower()}"
+        instance_numbers = _INSTANCE_RE.findall(haystack)
+        if not instance_numbers:
+            continue
+
+        stats = instance_tests.setdefault(
+            f"instance{min(instance_numbers)}", {"passed": 0, "failed": 0, "time": 0.0}
+        )
+        if status == "passed":
+            stats["passed"] += 1
+        else:
+            stats["failed"] += 1
+        stats["time"] += test["time"]
+
+    return failed_tests, error_tests, instance_tests
+
+
 class MarkdownSection(ABC):
     """Base class for report sections using Template Method pattern."""
 
@@ -121,8 +163,8 @@ class FailedTestsSection(MarkdownSection):
 
     MAX_FAILURES_SHOWN = 10
 
-    def __init__(self, test_cases: list[dict]):
-        self.failed_tests = [tc for tc in test_cases if tc["status"] == "failed"]
+    def __init__(self, failed_tests: list[dict]):
+        self.failed_tests = failed_tests
 
     def should_render(self) -> bool:
         return len(self.failed_tests) > 0
@@ -154,8 +196,8 @@ class ErrorTestsSection(MarkdownSection):
 
     MAX_ERRORS_SHOWN = 5
 
-    def __init__(self, test_cases: list[dict]):
-        self.error_tests = [tc for tc in test_cases if tc["status"] == "error"]
+    def __init__(self, error_tests: list[dict]):
+        self.error_tests = error_tests
 
     def should_render(self) -> bool:
         return len(self.error_tests) > 0
@@ -185,25 +227,8 @@ class ErrorTestsSection(MarkdownSection):
 class InstancePerformanceSection(MarkdownSection):
     """Renders instance-specific performance metrics."""
 
-    def __init__(self, test_cases: list[dict]):
-        self.instance_tests = self._analyze_instance_tests(test_cases)
-
-    def _analyze_instance_tests(self, test_cases: list[dict]) -> dict:
-        instance_tests = {}
-        for test in test_cases:
-            for i in range(1, 7):
-                instance_id = f"instance{i}"
-                if instance_id in test["classname"].lower() or instance_id in test["name"].lower():
-                    if instance_id not in instance_tests:
-                        instance_tests[instance_id] = {"passed": 0, "failed": 0, "time": 0.0}
-
-                    if test["status"] == "passed":
-                        instance_tests[instance_id]["passed"] += 1
-                    else:
-                        instance_tests[instance_id]["failed"] += 1
-                    instance_tests[instance_id]["time"] += test["time"]
-                    break
-        return instance_tests
+    def __init__(self, instance_tests: dict[str, dict]):
+        self.instance_tests = instance_tests
 
     def should_render(self) -> bool:
         return len(self.instance_tests) > 0
@@ -307,6 +332,7 @@ def create_integration_report(
     """Factory function to create a complete integration report."""
     test_metrics = TestMetrics.from_junit(junit_results)
     coverage_metrics = CoverageMetrics.from_xml(coverage_data) if coverage_data else None
+    failed_tests, error_tests, instance_tests = partition_test_cases(junit_results["test_cases"])
 
     builder = ReportBuilder()
     builder.add_section(HeaderSection())
@@ -316,9 +342,9 @@ def create_integration_report(
 
     builder.add_section(TestSummarySection(test_metrics))
     builder.add_section(CoverageSection(coverage_metrics))
-    builder.add_section(FailedTestsSection(junit_results["test_cases"]))
-    builder.add_section(ErrorTestsSection(junit_results["test_cases"]))
-    builder.add_section(InstancePerformanceSection(junit_results["test_cases"]))
+    builder.add_section(FailedTestsSection(failed_tests))
+    builder.add_section(ErrorTestsSection(error_tests))
+    builder.add_section(InstancePerformanceSection(instance_tests))
     builder.add_section(RecommendationsSection(test_metrics, coverage_metrics))
 
     return builder.build()
@@ -1,8 +1,6 @@
 """Concrete commands for instance operations."""
 
-from pathlib import Path
-
-from scripts.domain.instance import InstanceInfo, OwnershipInfo, SharedResource
+from scripts.domain.instance import InstanceInfo, OwnershipInfo, SharedResource, paths_exist
 from scripts.patterns.commands import Command, CommandContext, CommandInvoker, CommandResult
 
 
@@ -88,6 +86,11 @@ class ValidateMappingsCommand(Command):
         all_paths: set[str] = set()
         output_lines = ["Validating instance ownership mappings..."]
 
+        # Check filesystem existence of every directory in one batch
+        existing = paths_exist(
+            [directory for instance in ctx.instances for directory in instance.directories]
+        )
+
         # Check each instance
         for instance in ctx.instances:
             output_lines.append(f"\n{instance.name}:")
@@ -101,7 +104,7 @@ class ValidateMappingsCommand(Command):
                     all_paths.add(directory)
 
                     # Check filesystem existence
-                    if Path(directory).exists():
+                    if existing[directory]:
                         output_lines.append(f"  ✅ {directory}")
                     else:
                         output_lines.append(f"  ⚠️  {directory} - does not exist yet")
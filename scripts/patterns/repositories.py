@@ -6,6 +6,7 @@ the data access logic for loading and querying interface contracts.
 """
 
 import ast
+import pickle
 from pathlib import Path
 from typing import Optional
 
@@ -77,6 +78,49 @@ class InterfaceRepository:
         except Exception as e:
             raise RuntimeError(f"Failed to load contracts from {self.contracts_path}: {e}")
 
+    def load_cached(self, cache_path: Path) -> None:
+        """Load interface definitions, reusing a previous run's parse if current.
+
+        The cache is keyed on the contracts file's path, modification time
+        and size, so editing the contracts invalidates it.
+
+        Args:
+            cache_path: Pickle file holding the parsed definitions
+
+        Raises:
+            RuntimeError: If the contracts file has to be parsed and can't be
+        """
+        try:
+            stat = self.contracts_path.stat()
+        except OSError:
+            # Nothing to key the cache on; load() handles a missing file
+            self.load()
+            return
+
+        key = (str(self.contracts_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+        try:
+            with cache_path.open("rb") as f:
+                cached_key, contracts = pickle.load(f)
+        except Exception:
+            # Missing, corrupt, or written by an incompatible version
+            cached_key = None
+
+        if cached_key == key:
+            self._contracts = contracts
+            self._loaded = True
+            return
+
+        self.load()
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with cache_path.open("wb") as f:
+                pickle.dump((key, self._contracts), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            # The cache is only an optimization
+            pass
+
     def _ensure_loaded(self) -> None:
         """Ensure contracts are loaded before access."""
         if not self._loaded:
@@ -126,15 +126,10 @@ class OwnedPathValidator(ImportValidator):
 
         module_path = import_stmt.module_path
 
-        # Check if import is from owned paths
-        for owned in ctx.owned_paths:
-            if module_path.startswith(owned):
-                return None
-
-        # Check if import is from allowed paths
-        for allowed in ctx.allowed_imports:
-            if module_path.startswith(allowed):
-                return None
+        # Check if import is from owned or allowed paths
+        # (str.startswith checks a whole tuple of prefixes in one C call)
+        if module_path.startswith((*ctx.owned_paths, *ctx.allowed_imports)):
+            return None
 
         # Import is not from owned or allowed paths
         # (will be caught by CrossInstanceValidator if it's from another instance)
@@ -167,8 +162,8 @@ class SharedImportValidator(ImportValidator):
         module_path = import_stmt.module_path
 
         # Check if this is a shared module import
-        shared_prefixes = ["src/mia_rag/common/", "src/mia_rag/interfaces/"]
-        is_shared = any(module_path.startswith(prefix) for prefix in shared_prefixes)
+        shared_prefixes = ("src/mia_rag/common/", "src/mia_rag/interfaces/")
+        is_shared = module_path.startswith(shared_prefixes)
 
         if is_shared:
             # Could add additional validation logic here
@@ -210,15 +205,14 @@ class CrossInstanceValidator(ImportValidator):
                 continue
 
             # Check if importing from this instance's paths
-            for other_path in owned_paths:
-                if module_path.startswith(other_path):
-                    return ImportViolation(
-                        import_statement=import_stmt,
-                        validator_name="CrossInstanceValidator",
-                        message=f"Cannot import from {other_instance}'s module: "
-                        f"{import_stmt.module} (line {import_stmt.line_number})",
-                        severity="error",
-                    )
+            if module_path.startswith(tuple(owned_paths)):
+                return ImportViolation(
+                    import_statement=import_stmt,
+                    validator_name="CrossInstanceValidator",
+                    message=f"Cannot import from {other_instance}'s module: "
+                    f"{import_stmt.module} (line {import_stmt.line_number})",
+                    severity="error",
+                )
 
         return None
 
@@ -13,6 +13,28 @@ from scripts.domain.interfaces import InterfaceDefinition, ValidationContext
 from scripts.patterns.repositories import InterfaceRepository
 
 
+# Nodes that can hold statements; expressions never do
+_STATEMENT_NODES = (ast.stmt, ast.excepthandler, ast.match_case)
+
+
+def _base_names(node: ast.ClassDef) -> list[str]:
+    """Names of a class's bases, e.g. ``Foo`` for both ``Foo`` and ``mod.Foo``.
+
+    Args:
+        node: ClassDef AST node
+
+    Returns:
+        Base names, skipping bases that are neither names nor attributes
+    """
+    names = []
+    for base in node.bases:
+        if isinstance(base, ast.Name):
+            names.append(base.id)
+        elif isinstance(base, ast.Attribute):
+            names.append(base.attr)
+    return names
+
+
 class InterfaceVisitor(ast.NodeVisitor, ABC):
     """Base visitor for interface validation.
 
@@ -36,6 +58,22 @@ class InterfaceVisitor(ast.NodeVisitor, ABC):
         self.ctx = ctx
         self.repository = repository
 
+    def generic_visit(self, node: ast.AST) -> None:
+        """Visit the statements nested in a node, skipping its expressions.
+
+        Everything the visitors check (imports, classes, functions) is a
+        statement, and statements never occur inside expressions, so the
+        expression subtrees that make up most of a module aren't walked.
+
+        Args:
+            node: AST node whose children to visit
+        """
+        for _, value in ast.iter_fields(node):
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, _STATEMENT_NODES):
+                        self.visit(item)
+
     @abstractmethod
     def get_violations(self) -> list:
         """Return collected violations.
@@ -92,28 +130,20 @@ class InterfaceInheritanceVisitor(InterfaceVisitor):
             node: ClassDef AST node
         """
         # Track which interfaces this class claims to implement
-        for base in node.bases:
-            interface_name = None
-
-            if isinstance(base, ast.Name):
-                interface_name = base.id
-            elif isinstance(base, ast.Attribute):
-                interface_name = base.attr
-
-            if interface_name:
-                # Check if this is a known interface
-                if self.repository.has_interface(interface_name):
-                    self.ctx.declared_interfaces.add(interface_name)
-
-                    # Warn if interface not imported
-                    if interface_name not in self._imports:
-                        self.ctx.add_violation(
-                            line_number=node.lineno,
-                            violation_type="missing_import",
-                            message=f"Interface '{interface_name}' not imported",
-                            severity="warning",
-                            class_name=node.name,
-                        )
+        for interface_name in _base_names(node):
+            # Check if this is a known interface
+            if self.repository.has_interface(interface_name):
+                self.ctx.declared_interfaces.add(interface_name)
+
+                # Warn if interface not imported
+                if interface_name not in self._imports:
+                    self.ctx.add_violation(
+                        line_number=node.lineno,
+                        violation_type="missing_import",
+                        message=f"Interface '{interface_name}' not imported",
+                        severity="warning",
+                        class_name=node.name,
+                    )
 
         self.generic_visit(node)
 
@@ -152,36 +182,28 @@ class MethodImplementationVisitor(InterfaceVisitor):
                 self.ctx.track_method(node.name, item.name)
 
         # Check each interface this class implements
-        for base in node.bases:
-            interface_name = None
-
-            if isinstance(base, ast.Name):
-                interface_name = base.id
-            elif isinstance(base, ast.Attribute):
-                interface_name = base.attr
-
-            if interface_name:
-                interface_def = self.repository.get_interface(interface_name)
-
-                if interface_def:
-                    # Check that all required methods are implemented
-                    required_methods = interface_def.get_all_method_names()
-                    missing_methods = required_methods - class_methods
-
-                    for method_name in missing_methods:
-                        # Find the full signature for better error message
-                        full_sig = next(
-                            (sig for sig in interface_def.methods if sig.startswith(method_name)),
-                            method_name,
-                        )
-
-                        self.ctx.add_violation(
-                            line_number=node.lineno,
-                            violation_type="missing_method",
-                            message=f"{node.name} missing method: {full_sig}",
-                            severity="error",
-                            class_name=node.name,
-                        )
+        for interface_name in _base_names(node):
+            interface_def = self.repository.get_interface(interface_name)
+
+            if interface_def:
+                # Check that all required methods are implemented
+                required_methods = interface_def.all_method_names
+                missing_methods = required_methods - class_methods
+
+                for method_name in missing_methods:
+                    # Find the full signature for better error message
+                    full_sig = next(
+                        (sig for sig in interface_def.methods if sig.startswith(method_name)),
+                        method_name,
+                    )
+
+                    self.ctx.add_violation(
+                        line_number=node.lineno,
+                        violation_type="missing_method",
+                        message=f"{node.name} missing method: {full_sig}",
+                        severity="error",
+                        class_name=node.name,
+                    )
 
         # Continue traversal
         self.generic_visit(node)
@@ -274,19 +296,24 @@ class InterfaceValidator:
             TypeAnnotationVisitor,
         ]
 
-    def validate(self, file_path, *, enable_type_checking: bool = False):
+    def validate(
+        self, file_path, *, source: bytes | None = None, enable_type_checking: bool = False
+    ):
         """Validate interface implementation in a file.
 
         Args:
             file_path: Path to Python file to validate
+            source: The file's contents, if already read; saves reading it again
             enable_type_checking: Whether to enable strict type annotation checking
 
         Returns:
             List of InterfaceViolation objects
         """
         try:
-            with open(file_path) as f:
-                tree = ast.parse(f.read(), filename=str(file_path))
+            if source is None:
+                with open(file_path, "rb") as f:
+                    source = f.read()
+            tree = ast.parse(source, filename=str(file_path))
         except SyntaxError as e:
             from scripts.domain.interfaces import InterfaceViolation
             return [
@@ -0,0 +1,92 @@
+"""Unit tests for extracting release notes from CHANGELOG.md."""
+
+import sys
+from pathlib import Path
+
+
+# Add scripts directory to path so we can import like the scripts do
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from extract_release_notes import extract_release_notes, get_release_date
+
+
+CHANGELOG = """# Changelog
+
+## [0.2.0] - 2025-11-08 - "Second"
+
+### Added
+- Thing one
+- Thing two
+
+## [0.1.0] - 2025-10-01
+
+### Added
+- First release
+
+[Unreleased]: https://example.com/compare/v0.2.0...HEAD
+"""
+
+
+class TestExtractReleaseNotes:
+    """Test extracting one version's section."""
+
+    def test_extracts_section_until_next_version(self, tmp_path):
+        """Test that notes stop at the next version header."""
+        changelog = tmp_path / "CHANGELOG.md"
+        changelog.write_text(CHANGELOG, encoding="utf-8")
+
+        notes = extract_release_notes("0.2.0", changelog)
+
+        assert notes == (
+            "# Release v0.2.0\n\n"
+            "**Release Date:** 2025-11-08\n"
+            "**Git Tag:** v0.2.0\n\n"
+            "### Added\n- Thing one\n- Thing two"
+        )
+
+    def test_last_version_stops_at_links(self, tmp_path):
+        """Test that the last section ends before the link definitions."""
+        changelog = tmp_path / "CHANGELOG.md"
+        changelog.write_text(CHANGELOG, encoding="utf-8")
+
+        notes = extract_release_notes("0.1.0", changelog)
+
+        assert notes.endswith("**Git Tag:** v0.1.0\n\n### Added\n- First release")
+
+    def test_crlf_line_endings_are_normalized(self, tmp_path):
+        """Test that a CRLF changelog gives the same notes as an LF one."""
+        lf_changelog = tmp_path / "lf.md"
+        lf_changelog.write_bytes(CHANGELOG.encode("utf-8"))
+        crlf_changelog = tmp_path / "crlf.md"
+        crlf_changelog.write_bytes(CHANGELOG.replace("\n", "\r\n").encode("utf-8"))
+
+        notes = extract_release_notes("0.2.0", crlf_changelog)
+
+        assert "\r" not in notes
+        assert notes == extract_release_notes("0.2.0", lf_changelog)
+
+    def test_missing_version(self, tmp_path):
+        """Test the message for a version that isn't in the changelog."""
+        changelog = tmp_path / "CHANGELOG.md"
+        changelog.write_text(CHANGELOG, encoding="utf-8")
+
+        assert extract_release_notes("9.9.9", changelog) == "Version 9.9.9 not found in changelog"
+
+    def test_empty_changelog(self, tmp_path):
+        """Test that an empty changelog has no versions."""
+        changelog = tmp_path / "CHANGELOG.md"
+        changelog.touch()
+
+        assert extract_release_notes("0.2.0", changelog) == "Version 0.2.0 not found in changelog"
+
+
+class TestGetReleaseDate:
+    """Test reading a version's release date."""
+
+    def test_release_date(self):
+        """Test that the date follows the version header."""
+        assert get_release_date(CHANGELOG, "0.1.0") == "2025-10-01"
+
+    def test_unknown_release_date(self):
+        """Test the fallback for a version without a date."""
+        assert get_release_date(CHANGELOG, "9.9.9") == "Unknown"
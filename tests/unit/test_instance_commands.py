@@ -8,7 +8,7 @@ import pytest
 # Add scripts directory to path so we can import like the scripts do
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
 
-from domain.instance import InstanceInfo, OwnershipInfo, SharedResource
+from domain.instance import InstanceInfo, OwnershipIndex, OwnershipInfo, SharedResource
 from patterns.commands import CommandContext, CommandResult
 from patterns.instance_commands import (
     CheckOwnershipCommand,
@@ -170,6 +170,44 @@ class TestOwnershipInfo:
         assert not ownership.requires_coordination
 
 
+class TestOwnershipIndex:
+    """Test OwnershipIndex lookups."""
+
+    def test_lookup_owners(self, instances, shared_resources):
+        """Test index resolves owners by plain string prefix."""
+        index = OwnershipIndex(instances, shared_resources)
+
+        assert index.lookup("src/storage/file.py").owner == "instance1"
+        assert index.lookup("src/storage_extra/file.py").owner == "instance1"
+        assert index.lookup("tests/unit/embeddings/test_foo.py").owner == "instance2"
+        assert index.lookup("pyproject.toml").owner == "shared"
+        assert index.lookup("random/file.py").owner is None
+        assert index.lookup("").owner is None
+
+    def test_shared_outranks_instances(self):
+        """Test a shared path wins over a longer instance directory."""
+        index = OwnershipIndex(
+            [InstanceInfo(name="instance1", modules=[], directories=["src/common/storage"])],
+            [SharedResource(category="interfaces", paths=["src/common"])],
+        )
+
+        ownership = index.lookup("src/common/storage/file.py")
+        assert ownership.owner == "shared"
+        assert ownership.requires_coordination
+
+    def test_earlier_instance_outranks_later(self):
+        """Test overlapping directories resolve to the first instance listed."""
+        index = OwnershipIndex(
+            [
+                InstanceInfo(name="instance1", modules=[], directories=["src"]),
+                InstanceInfo(name="instance2", modules=[], directories=["src/embeddings"]),
+            ],
+            [],
+        )
+
+        assert index.lookup("src/embeddings/model.py").owner == "instance1"
+
+
 class TestCheckOwnershipCommand:
     """Test CheckOwnershipCommand."""
 
@@ -91,6 +91,13 @@ class TestInterfaceDefinition:
         names = definition.get_all_method_names()
         assert names == {"foo", "bar", "baz"}
 
+    def test_all_method_names_cached(self):
+        """Test method names are computed once per definition."""
+        definition = InterfaceDefinition(name="TestInterface", methods=["foo()", "bar(x)"])
+
+        assert definition.all_method_names == frozenset({"foo", "bar"})
+        assert definition.all_method_names is definition.all_method_names
+
 
 class TestValidationContext:
     """Test the ValidationContext."""
@@ -179,6 +186,45 @@ class TestInterface(ABC):
         finally:
             contracts_path.unlink()
 
+    def test_repository_load_cached_reuses_parse(self, tmp_path, monkeypatch):
+        """Test a second load_cached call is served from the cache file."""
+        contracts_path = tmp_path / "contracts.py"
+        contracts_path.write_text(
+            "from abc import ABC, abstractmethod\n\n"
+            "class TestInterface(ABC):\n"
+            "    @abstractmethod\n"
+            "    def foo(self):\n"
+            "        pass\n"
+        )
+        cache_path = tmp_path / "cache" / "contracts.pkl"
+
+        InterfaceRepository(contracts_path=contracts_path).load_cached(cache_path)
+        assert cache_path.exists()
+
+        def fail_load(self):
+            raise AssertionError("contracts were parsed again")
+
+        monkeypatch.setattr(InterfaceRepository, "load", fail_load)
+        repo = InterfaceRepository(contracts_path=contracts_path)
+        repo.load_cached(cache_path)
+
+        assert repo.get_required_methods("TestInterface") == {"foo"}
+
+    def test_repository_load_cached_detects_changes(self, tmp_path):
+        """Test editing the contracts file invalidates the cache."""
+        contracts_path = tmp_path / "contracts.py"
+        contracts_path.write_text("from abc import ABC\n\nclass OldInterface(ABC):\n    pass\n")
+        cache_path = tmp_path / "contracts.pkl"
+
+        InterfaceRepository(contracts_path=contracts_path).load_cached(cache_path)
+        contracts_path.write_text("from abc import ABC\n\nclass NewInterface(ABC):\n    pass\n\n")
+
+        repo = InterfaceRepository(contracts_path=contracts_path)
+        repo.load_cached(cache_path)
+
+        assert repo.has_interface("NewInterface")
+        assert not repo.has_interface("OldInterface")
+
 
 class TestMethodImplementationVisitor:
     """Test the MethodImplementationVisitor."""
@@ -266,6 +312,31 @@ class TestClass(TestInterface):
         finally:
             contracts_path.unlink()
 
+    def test_checks_nested_classes(self, tmp_path):
+        """Test visitor reaches classes nested in functions and blocks."""
+        repo = InterfaceRepository(contracts_path=tmp_path / "contracts.py")
+        repo._contracts = {
+            "TestInterface": InterfaceDefinition(name="TestInterface", methods=["foo()"])
+        }
+        repo._loaded = True
+
+        test_code = """
+def factory():
+    if True:
+        try:
+            pass
+        except ValueError:
+            class Inner(TestInterface):
+                pass
+    return [lambda: None]
+"""
+
+        ctx = ValidationContext(file_path=Path("test.py"))
+        MethodImplementationVisitor(ctx, repo).visit(ast.parse(test_code))
+
+        violations = [v for v in ctx.violations if v.violation_type == "missing_method"]
+        assert [v.class_name for v in violations] == ["Inner"]
+
 
 class TestInterfaceValidator:
     """Test the InterfaceValidator orchestrator."""
@@ -339,6 +410,19 @@ class TestClass(TestInterface):
             contracts_path.unlink()
             impl_path.unlink()
 
+    def test_validator_uses_given_source(self, tmp_path):
+        """Test validator parses source passed in instead of reading the file."""
+        contracts_path = tmp_path / "contracts.py"
+        contracts_path.write_text("# Mock contracts")
+        # Never written; reading it would fail with a parse_error violation
+        impl_path = tmp_path / "impl.py"
+
+        validator = InterfaceValidator(InterfaceRepository(contracts_path=contracts_path))
+        violations = validator.validate(impl_path, source=b"class TestClass(:\n    pass")
+
+        assert len(violations) == 1
+        assert violations[0].violation_type == "syntax_error"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
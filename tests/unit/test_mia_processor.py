@@ -0,0 +1,132 @@
+"""Unit tests for HTML to markdown conversion in mia_processor."""
+
+import sys
+from pathlib import Path
+
+import pymupdf
+import pytest
+
+
+# Add the repository root to path so we can import the processor script
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from bs4 import BeautifulSoup
+from mia_processor import (
+    BLANK_LINES_RE,
+    BODY_STRAINER,
+    MARKDOWN_CONVERTER,
+    html_to_markdown,
+    pdf_header_info,
+    pdf_pages_to_markdown,
+    pdf_to_markdown,
+)
+from selectolax.lexbor import LexborHTMLParser
+
+
+def convert(tmp_path: Path, body: str) -> str:
+    """Run html_to_markdown on a page with the given body."""
+    archive_root = tmp_path / "archive"
+    html_file = archive_root / "marx" / "works" / "page.htm"
+    html_file.parent.mkdir(parents=True)
+    html_file.write_text(f"<html><body>{body}</body></html>", encoding="utf-8")
+
+    result = html_to_markdown(str(html_file), str(archive_root), "2025-01-01")
+    assert result is not None
+    return result[0].decode("utf-8")
+
+
+def markdownify(body: str) -> str:
+    """Convert a page body with markdownify alone, as complex pages are."""
+    tree = LexborHTMLParser(f"<html><body>{body}</body></html>")
+    soup = BeautifulSoup(tree.html, "lxml", parse_only=BODY_STRAINER)
+    return BLANK_LINES_RE.sub("\n\n", MARKDOWN_CONVERTER.convert_soup(soup))
+
+
+class TestBlankLines:
+    """Test collapsing runs of blank lines."""
+
+    def test_collapses_whitespace_only_lines(self):
+        """Test that lines of spaces and tabs count as blank."""
+        assert BLANK_LINES_RE.sub("\n\n", "a\n \n\t\n\nb") == "a\n\nb"
+
+    def test_keeps_single_blank_line(self):
+        """Test that a paragraph break is left alone."""
+        assert BLANK_LINES_RE.sub("\n\n", "a\n\nb\n  \nc") == "a\n\nb\n  \nc"
+
+    def test_collapses_non_breaking_space_lines(self):
+        """Test that &nbsp; spacer lines count as blank."""
+        assert BLANK_LINES_RE.sub("\n\n", "a\n\n\xa0  \n\nb") == "a\n\nb"
+
+    def test_nbsp_spacer_paragraphs(self, tmp_path):
+        """Test that &nbsp; spacer paragraphs don't survive conversion."""
+        body = "<p>Alpha</p><p>&nbsp;&nbsp;</p><br/>&nbsp;<br/><p>Beta</p><pre>x</pre>"
+
+        assert convert(tmp_path, body).startswith("Alpha\n\nBeta\n\n")
+
+
+class TestSimpleMarkdown:
+    """Test that the simple walker renders pages exactly as markdownify does."""
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            "<h1>Title</h1><p>Some <em>emphasis</em> and <a href='x.htm'>a link</a>.</p>",
+            "<ul><li>One</li><li>Two<ul><li>Nested</li></ul></li></ul>",
+            "<ol><li>First</li><li>Second</li></ol>",
+            "<blockquote><p>Quoted</p></blockquote><hr/><p>After</p>",
+            "<dl><dt>Term</dt><dd>Definition</dd></dl>",
+            '<ol start="3"><li>Third</li><li>Fourth</li></ol>',
+            "<p>Hello <!-- note --> world</p>",
+            "<p>Use <tt>foo</tt> here</p>",
+            "<p>Struck <s>out</s>, <del>deleted</del> and <strike>gone</strike></p>",
+            "<p>The <acronym>SPD</acronym>, a <dfn>term</dfn> and <var>x</var></p>",
+            "<p>Press <kbd>Ctrl</kbd> here</p>",
+            "<p>A paragraph whose source\n  wraps across lines</p>\n<p>Next&nbsp;one<br>\n line</p>",
+            "<ul>\n<li>Item text\nwrapped</li>\n</ul>\n<blockquote>Quote\nlines</blockquote>",
+            "<p><a href='a_b.htm'>a_b.htm</a> and <img src='x.gif' alt='pic'></p><h2>Cap <img src='x.gif' alt='t'></h2>",
+            "<font size=2>Small <b>bold<p>Inside bold</p></b><center>Centered</center></font>",
+        ],
+    )
+    def test_matches_markdownify(self, tmp_path, body):
+        """Test that content hashes don't depend on which converter ran."""
+        assert convert(tmp_path, body) == markdownify(body)
+
+
+class TestPdfPageRanges:
+    """Test that large PDFs convert the same in page ranges as whole."""
+
+    def test_ranges_match_whole_document(self, tmp_path):
+        """Test that a heading keeps its level in a range without larger fonts."""
+        page_count, range_size = 5, 2
+        # The only 24pt heading is in the first range; the second has 18pt only
+        headings = {0: [("Part One", 24), ("Chapter 1", 18)], 3: [("Chapter 2", 18)]}
+        pdf_file = tmp_path / "archive" / "marx" / "works" / "book.pdf"
+        pdf_file.parent.mkdir(parents=True)
+        with pymupdf.open() as doc:
+            for number in range(page_count):
+                page = doc.new_page()
+                y = 72
+                for text, size in headings.get(number, []):
+                    page.insert_text((72, y), text, fontsize=size)
+                    y += 40
+                page.insert_text((72, y), f"Body text of page {number}.", fontsize=11)
+            doc.save(pdf_file)
+
+        args = (str(pdf_file), str(tmp_path / "archive"), "2025-01-01")
+        hdr_info = pdf_header_info(str(pdf_file))
+        parts = [
+            pdf_pages_to_markdown(
+                str(pdf_file),
+                list(range(start, min(start + range_size, page_count))),
+                hdr_info,
+            )
+            for start in range(0, page_count, range_size)
+        ]
+
+        whole = pdf_to_markdown(*args)
+        split = pdf_to_markdown(*args, "".join(parts))
+        assert whole is not None
+        assert split is not None
+        assert "## Chapter 2" in whole[0].decode("utf-8")
+        assert split[0] == whole[0]
+        assert split[1].content_hash == whole[1].content_hash